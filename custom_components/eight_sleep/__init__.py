@@ -397,6 +397,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # stop the API before unloading everything
         config_entry_data: EightSleepConfigEntryData = hass.data[DOMAIN][entry.entry_id]
         await config_entry_data.api.stop()
+
+        from .health_check import async_unload_health_services
+        from .error_reporting import async_unload_error_reporting_services
+
+        await async_unload_health_services(hass, entry)
+        await async_unload_error_reporting_services(hass, entry)
         hass.data[DOMAIN].pop(entry.entry_id)
         if not hass.data[DOMAIN]:
             hass.data.pop(DOMAIN)
@@ -65,6 +65,7 @@ SERVICE_ALARM_DISMISS = "alarm_dismiss"
 SERVICE_AWAY_MODE_START = "away_mode_start"
 SERVICE_AWAY_MODE_STOP = "away_mode_stop"
 
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
 ATTR_TARGET = "target"
 ATTR_DURATION = "duration"
 ATTR_SERVICE_SLEEP_STAGE = "sleep_stage"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 import logging
 from typing import Any
 
@@ -152,6 +153,7 @@ def get_error_message(error_type: str, **kwargs: Any) -> dict[str, Any]:
 
     return message
 
+@lru_cache(maxsize=128)
 def categorize_error(error_type: str) -> str:
     """Categorize an error type into a general category."""
     for category, error_types in ERROR_CATEGORIES.items():
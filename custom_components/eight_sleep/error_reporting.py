@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from itertools import filterfalse, islice
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from operator import attrgetter
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_USERNAME
@@ -13,57 +19,114 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entity import Entity
 import voluptuous as vol
 
-from .const import DOMAIN
+from .const import ATTR_CONFIG_ENTRY_ID, DOMAIN
 from .error_messages import get_error_message, categorize_error, get_user_friendly_error
-from .util import EightSleepOfflineManager
+from .util import CONFIG_ENTRY_SERVICE_SCHEMA, EightSleepOfflineManager
 
 _LOGGER = logging.getLogger(__name__)
 
+SECONDS_PER_DAY = 86400
+
+# Seconds a generated error report is reused while nothing has changed
+REPORT_CACHE_TTL = 30
+
+# hass.data keys for storing service results
+ERROR_REPORTS_KEY = f"{DOMAIN}_error_reports"
+NOTIFICATIONS_KEY = f"{DOMAIN}_notifications"
+
+# Error reporters by config entry id, shared by the domain-wide services
+_REPORTERS: Dict[str, EightSleepErrorReporter] = {}
+
 # Service schemas
-ERROR_REPORT_SCHEMA = vol.Schema({
+ERROR_REPORT_SCHEMA = CONFIG_ENTRY_SERVICE_SCHEMA.extend({
     vol.Optional("include_history", default=True): cv.boolean,
     vol.Optional("include_diagnostics", default=False): cv.boolean,
 })
 
-ERROR_NOTIFICATION_SCHEMA = vol.Schema({
+ERROR_NOTIFICATION_SCHEMA = CONFIG_ENTRY_SERVICE_SCHEMA.extend({
     vol.Required("error_type"): cv.string,
     vol.Optional("entity_id", default=""): cv.string,
     vol.Optional("error_details", default=""): cv.string,
     vol.Optional("severity", default="warning"): vol.In(["info", "warning", "error"]),
 })
 
+@dataclass(slots=True, eq=False)
 class ErrorReport:
     """Represents an error report with metadata."""
 
-    def __init__(self, error_type: str, message: str, severity: str = "warning"):
-        """Initialize the error report."""
-        self.error_type = error_type
-        self.message = message
-        self.severity = severity
-        self.timestamp = datetime.now()
-        self.entity_id = ""
-        self.error_details = ""
-        self.resolved = False
-        self.resolution_time = None
+    error_type: str
+    message: str
+    severity: str = "warning"
+    entity_id: str = ""
+    error_details: str = ""
+    resolved: bool = False
+    resolution_time: Optional[datetime] = None
+    # Epoch seconds for cheap cutoff comparisons; timestamp is for display
+    created: float = field(default_factory=time.time)
+    timestamp: datetime = field(init=False)
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Derive the display timestamp from the creation time."""
+        self.timestamp = datetime.fromtimestamp(self.created)
 
     def resolve(self):
         """Mark the error as resolved."""
         self.resolved = True
         self.resolution_time = datetime.now()
+        self._dict_cache = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "error_type": self.error_type,
+                "message": self.message,
+                "severity": self.severity,
+                "timestamp": self.timestamp.isoformat(),
+                "entity_id": self.entity_id,
+                "error_details": self.error_details,
+                "resolved": self.resolved,
+                "resolution_time": self.resolution_time.isoformat() if self.resolution_time else None,
+            }
+        return self._dict_cache.copy()
+
+@dataclass(slots=True)
+class Notification:
+    """A user-facing notification generated from an error type."""
+
+    title: str
+    message: str
+    suggestion: str
+    severity: str
+    error_type: str
+    entity_id: str
+    error_details: str
+    category: str
+    timestamp: float = field(default_factory=time.time)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
-            "error_type": self.error_type,
+            "title": self.title,
             "message": self.message,
+            "suggestion": self.suggestion,
             "severity": self.severity,
-            "timestamp": self.timestamp.isoformat(),
+            "error_type": self.error_type,
             "entity_id": self.entity_id,
             "error_details": self.error_details,
-            "resolved": self.resolved,
-            "resolution_time": self.resolution_time.isoformat() if self.resolution_time else None,
+            "category": self.category,
+            "timestamp": datetime.fromtimestamp(self.timestamp).isoformat(),
         }
 
+_report_time = attrgetter("created")
+_notification_time = attrgetter("timestamp")
+_is_resolved = attrgetter("resolved")
+
+def _index_since(history: deque, days: float, key: Callable[[Any], float]) -> int:
+    """Return the index of the first entry in a time-ordered history within N days."""
+    return bisect_left(history, time.time() - days * SECONDS_PER_DAY, key=key)
+
 class EightSleepErrorReporter:
     """Error reporter for Eight Sleep integration."""
 
@@ -71,10 +134,60 @@ class EightSleepErrorReporter:
         """Initialize the error reporter."""
         self.hass = hass
         self.config_entry = config_entry
-        self._error_reports: List[ErrorReport] = []
-        self._notification_history: List[Dict[str, Any]] = []
         self._max_error_history = 50
         self._max_notification_history = 20
+        self._error_reports: deque[ErrorReport] = deque(maxlen=self._max_error_history)
+        self._notification_history: deque[Notification] = deque(
+            maxlen=self._max_notification_history
+        )
+
+        # Running statistics, kept in sync with _error_reports
+        self._severity_counts = {"info": 0, "warning": 0, "error": 0}
+        self._category_counts: Counter[str] = Counter()
+        self._active_count = 0
+
+        # Unresolved reports indexed by (error_type, entity_id), plus the
+        # keys present for each error_type, so resolve_error avoids a scan
+        self._unresolved_index: Dict[Tuple[str, str], List[ErrorReport]] = {}
+        self._unresolved_keys_by_type: Dict[str, Set[Tuple[str, str]]] = {}
+
+        # Bumped on every change to reports or notifications; used together
+        # with REPORT_CACHE_TTL to reuse the last generated report
+        self._revision = 0
+        self._report_cache: Optional[Tuple[Tuple[int, bool, bool], float, Dict[str, Any]]] = None
+
+    def _track_report(self, report: ErrorReport) -> None:
+        """Add a report to the running statistics and unresolved index."""
+        self._revision += 1
+        self._severity_counts[report.severity] += 1
+        self._category_counts[categorize_error(report.error_type)] += 1
+        if not report.resolved:
+            self._active_count += 1
+            key = (report.error_type, report.entity_id)
+            self._unresolved_index.setdefault(key, []).append(report)
+            self._unresolved_keys_by_type.setdefault(report.error_type, set()).add(key)
+
+    def _untrack_report(self, report: ErrorReport) -> None:
+        """Remove a report from the running statistics and unresolved index."""
+        self._revision += 1
+        self._severity_counts[report.severity] -= 1
+        self._category_counts[categorize_error(report.error_type)] -= 1
+        if not report.resolved:
+            self._active_count -= 1
+            key = (report.error_type, report.entity_id)
+            reports = self._unresolved_index[key]
+            reports.remove(report)
+            if not reports:
+                self._drop_unresolved_key(key)
+
+    def _drop_unresolved_key(self, key: Tuple[str, str]) -> List[ErrorReport]:
+        """Remove a key from the unresolved index and return its reports."""
+        reports = self._unresolved_index.pop(key)
+        keys = self._unresolved_keys_by_type[key[0]]
+        keys.discard(key)
+        if not keys:
+            del self._unresolved_keys_by_type[key[0]]
+        return reports
 
     def add_error_report(
         self,
@@ -85,15 +198,13 @@ class EightSleepErrorReporter:
         error_details: str = ""
     ) -> ErrorReport:
         """Add a new error report."""
-        error_report = ErrorReport(error_type, message, severity)
-        error_report.entity_id = entity_id
-        error_report.error_details = error_details
+        error_report = ErrorReport(error_type, message, severity, entity_id, error_details)
 
+        # Keep only the most recent error reports; the deque drops the oldest
+        if len(self._error_reports) == self._error_reports.maxlen:
+            self._untrack_report(self._error_reports[0])
         self._error_reports.append(error_report)
-
-        # Keep only the most recent error reports
-        if len(self._error_reports) > self._max_error_history:
-            self._error_reports.pop(0)
+        self._track_report(error_report)
 
         _LOGGER.debug("Added error report: %s - %s", error_type, message)
         return error_report
@@ -108,58 +219,63 @@ class EightSleepErrorReporter:
         """Add a notification for the user interface."""
         error_message = get_error_message(error_type)
 
-        notification_data = {
-            "title": error_message["title"],
-            "message": error_message["message"],
-            "suggestion": error_message["suggestion"],
-            "severity": severity,
-            "error_type": error_type,
-            "entity_id": entity_id,
-            "error_details": error_details,
-            "category": categorize_error(error_type),
-            "timestamp": datetime.now().isoformat(),
-        }
-
-        self._notification_history.append(notification_data)
+        notification = Notification(
+            title=error_message["title"],
+            message=error_message["message"],
+            suggestion=error_message["suggestion"],
+            severity=severity,
+            error_type=error_type,
+            entity_id=entity_id,
+            error_details=error_details,
+            category=categorize_error(error_type),
+        )
 
-        # Keep only the most recent notifications
-        if len(self._notification_history) > self._max_notification_history:
-            self._notification_history.pop(0)
+        # Keep only the most recent notifications; the deque drops the oldest
+        self._notification_history.append(notification)
+        self._revision += 1
 
         _LOGGER.info("Added notification: %s - %s", error_type, error_message["message"])
-        return notification_data
+        return notification.to_dict()
 
     def get_active_errors(self) -> List[ErrorReport]:
-        """Get all active (unresolved) error reports."""
-        return [report for report in self._error_reports if not report.resolved]
+        """Get all active (unresolved) error reports, oldest first."""
+        return list(filterfalse(_is_resolved, self._error_reports))
 
     def get_error_history(self, days: int = 7) -> List[ErrorReport]:
-        """Get error reports from the last N days."""
-        cutoff_date = datetime.now() - timedelta(days=days)
-        return [
-            report for report in self._error_reports
-            if report.timestamp >= cutoff_date
-        ]
+        """Get error reports from the last N days.
+
+        Reports and notifications are appended in chronological order, so the
+        cutoff is located with a binary search rather than a full scan.
+        """
+        start = _index_since(self._error_reports, days, _report_time)
+        return list(islice(self._error_reports, start, None))
 
     def get_notification_history(self, days: int = 7) -> List[Dict[str, Any]]:
         """Get notification history from the last N days."""
-        cutoff_date = datetime.now() - timedelta(days=days)
+        start = _index_since(self._notification_history, days, _notification_time)
         return [
-            notification for notification in self._notification_history
-            if datetime.fromisoformat(notification["timestamp"]) >= cutoff_date
+            notification.to_dict()
+            for notification in islice(self._notification_history, start, None)
         ]
 
     def resolve_error(self, error_type: str, entity_id: str = "") -> bool:
         """Resolve an error by type and optionally entity_id."""
         resolved_count = 0
 
-        for report in self._error_reports:
-            if (report.error_type == error_type and
-                (not entity_id or report.entity_id == entity_id) and
-                not report.resolved):
+        if entity_id:
+            keys = [(error_type, entity_id)] if (error_type, entity_id) in self._unresolved_index else []
+        else:
+            keys = list(self._unresolved_keys_by_type.get(error_type, ()))
+
+        for key in keys:
+            for report in self._drop_unresolved_key(key):
                 report.resolve()
                 resolved_count += 1
 
+        self._active_count -= resolved_count
+        if resolved_count:
+            self._revision += 1
+
         if resolved_count > 0:
             _LOGGER.info("Resolved %d error(s) of type: %s", resolved_count, error_type)
 
@@ -168,26 +284,15 @@ class EightSleepErrorReporter:
     def get_error_summary(self) -> Dict[str, Any]:
         """Get a summary of error statistics."""
         total_errors = len(self._error_reports)
-        active_errors = len(self.get_active_errors())
+        active_errors = self._active_count
         resolved_errors = total_errors - active_errors
 
-        # Count by severity
-        severity_counts = {"info": 0, "warning": 0, "error": 0}
-        for report in self._error_reports:
-            severity_counts[report.severity] += 1
-
-        # Count by category
-        category_counts = {}
-        for report in self._error_reports:
-            category = categorize_error(report.error_type)
-            category_counts[category] = category_counts.get(category, 0) + 1
-
         return {
             "total_errors": total_errors,
             "active_errors": active_errors,
             "resolved_errors": resolved_errors,
-            "severity_counts": severity_counts,
-            "category_counts": category_counts,
+            "severity_counts": dict(self._severity_counts),
+            "category_counts": dict(+self._category_counts),
             "resolution_rate": (resolved_errors / total_errors * 100) if total_errors > 0 else 0,
         }
 
@@ -196,17 +301,34 @@ class EightSleepErrorReporter:
         include_history: bool = True,
         include_diagnostics: bool = False
     ) -> Dict[str, Any]:
-        """Generate a comprehensive error report."""
+        """Generate a comprehensive error report.
+
+        A report generated less than REPORT_CACHE_TTL seconds ago with the same
+        options is returned as-is if no reports or notifications changed since.
+        """
+        cache_key = (self._revision, include_history, include_diagnostics)
+        now = time.monotonic()
+        if self._report_cache is not None:
+            cached_key, generated_at, cached_report = self._report_cache
+            if cached_key == cache_key and now - generated_at < REPORT_CACHE_TTL:
+                return cached_report
+
+        # Serialize active reports once and reuse them in the history below
+        active_dicts = {id(error): error.to_dict() for error in self.get_active_errors()}
+
         report = {
             "timestamp": datetime.now().isoformat(),
             "config_entry_id": self.config_entry.entry_id,
             "error_summary": self.get_error_summary(),
-            "active_errors": [report.to_dict() for report in self.get_active_errors()],
+            "active_errors": list(active_dicts.values()),
             "recent_notifications": self.get_notification_history(1),  # Last 24 hours
         }
 
         if include_history:
-            report["error_history"] = [report.to_dict() for report in self.get_error_history()]
+            report["error_history"] = [
+                active_dicts.get(id(error)) or error.to_dict()
+                for error in self.get_error_history()
+            ]
             report["notification_history"] = self.get_notification_history()
 
         if include_diagnostics:
@@ -218,19 +340,15 @@ class EightSleepErrorReporter:
             except Exception as err:
                 report["diagnostics_error"] = str(err)
 
+        self._report_cache = (cache_key, now, report)
         return report
 
     def clear_old_errors(self, days: int = 30) -> int:
         """Clear error reports older than N days."""
-        cutoff_date = datetime.now() - timedelta(days=days)
-        original_count = len(self._error_reports)
-
-        self._error_reports = [
-            report for report in self._error_reports
-            if report.timestamp >= cutoff_date
-        ]
-
-        cleared_count = original_count - len(self._error_reports)
+        # Reports are stored oldest first, so the expired ones form a prefix
+        cleared_count = _index_since(self._error_reports, days, _report_time)
+        for _ in range(cleared_count):
+            self._untrack_report(self._error_reports.popleft())
         if cleared_count > 0:
             _LOGGER.info("Cleared %d old error reports", cleared_count)
 
@@ -247,13 +365,20 @@ class EightSleepErrorReportingEntity(Entity):
         self._attr_unique_id = f"{config_entry.entry_id}_error_reporting"
         self._attr_icon = "mdi:alert-circle"
         self._attr_entity_category = "diagnostic"
+        self._offline_manager: Optional[EightSleepOfflineManager] = None
+
+    def _get_offline_manager(self) -> EightSleepOfflineManager:
+        """Return the offline manager, resolving it from hass.data on first use."""
+        if self._offline_manager is None:
+            config_entry_data = self.hass.data[DOMAIN][self.config_entry.entry_id]
+            self._offline_manager = config_entry_data.offline_manager
+        return self._offline_manager
 
     @property
     def state(self) -> str:
         """Return the state of the entity."""
         try:
-            config_entry_data = self.hass.data[DOMAIN][self.config_entry.entry_id]
-            offline_manager = config_entry_data.offline_manager
+            offline_manager = self._get_offline_manager()
 
             if offline_manager.is_offline:
                 return "offline"
@@ -268,37 +393,60 @@ class EightSleepErrorReportingEntity(Entity):
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return entity specific state attributes."""
         try:
-            config_entry_data = self.hass.data[DOMAIN][self.config_entry.entry_id]
-            offline_manager = config_entry_data.offline_manager
+            offline_manager = self._get_offline_manager()
+            connection_status = offline_manager.connection_status
 
             return {
-                "connection_status": offline_manager.get_offline_status_message(),
-                "connection_errors": offline_manager.connection_status.connection_errors,
-                "success_rate": offline_manager.connection_status.success_rate,
-                "last_online": offline_manager.connection_status.last_online.isoformat(),
-                "cache_hit_rate": offline_manager.cache.get_cache_stats()["hit_rate"],
+                "connection_status": connection_status.get_status_message(),
+                "connection_errors": connection_status.connection_errors,
+                "success_rate": connection_status.success_rate,
+                "last_online": connection_status.last_online.isoformat(),
+                "cache_hit_rate": offline_manager.cache.hit_rate,
             }
         except Exception:
             return {}
 
+def _get_target_reporters(call: ServiceCall) -> List[EightSleepErrorReporter]:
+    """Return the reporters a service call applies to.
+
+    Calls without a config entry id apply to every configured account.
+    """
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    if not entry_id:
+        return list(_REPORTERS.values())
+    if entry_id not in _REPORTERS:
+        _LOGGER.warning("No Eight Sleep error reporter for config entry: %s", entry_id)
+        return []
+    return [_REPORTERS[entry_id]]
+
 async def async_setup_error_reporting_services(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
-    """Set up error reporting services."""
+    """Set up error reporting services.
 
-    error_reporter = EightSleepErrorReporter(hass, config_entry)
+    Services are registered once for the domain; each config entry only adds
+    its reporter to the shared registry.
+    """
+
+    _REPORTERS[config_entry.entry_id] = EightSleepErrorReporter(hass, config_entry)
+    error_reports = hass.data.setdefault(ERROR_REPORTS_KEY, {})
+    notifications = hass.data.setdefault(NOTIFICATIONS_KEY, {})
+    notifications.setdefault(config_entry.entry_id, [])
+
+    if hass.services.has_service(DOMAIN, "error_report"):
+        return
 
     async def error_report_service(call: ServiceCall) -> None:
         """Service to generate error report."""
         include_history = call.data.get("include_history", True)
         include_diagnostics = call.data.get("include_diagnostics", False)
 
-        report = error_reporter.generate_error_report(include_history, include_diagnostics)
+        for error_reporter in _get_target_reporters(call):
+            report = await error_reporter.generate_error_report(include_history, include_diagnostics)
 
-        # Store report in hass data for potential UI access
-        hass.data.setdefault(f"{DOMAIN}_error_reports", {})
-        hass.data[f"{DOMAIN}_error_reports"][config_entry.entry_id] = report
+            # Store report in hass data for potential UI access
+            error_reports[error_reporter.config_entry.entry_id] = report
 
-        _LOGGER.info("Error report generated with %d active errors",
-                    report["error_summary"]["active_errors"])
+            _LOGGER.info("Error report generated with %d active errors",
+                        report["error_summary"]["active_errors"])
 
     async def error_notification_service(call: ServiceCall) -> None:
         """Service to add error notification."""
@@ -307,17 +455,15 @@ async def async_setup_error_reporting_services(hass: HomeAssistant, config_entry
         error_details = call.data.get("error_details", "")
         severity = call.data.get("severity", "warning")
 
-        notification = error_reporter.add_notification(
-            error_type, entity_id, error_details, severity
-        )
+        for error_reporter in _get_target_reporters(call):
+            notification = error_reporter.add_notification(
+                error_type, entity_id, error_details, severity
+            )
 
-        # Store notification in hass data for potential UI access
-        hass.data.setdefault(f"{DOMAIN}_notifications", {})
-        if config_entry.entry_id not in hass.data[f"{DOMAIN}_notifications"]:
-            hass.data[f"{DOMAIN}_notifications"][config_entry.entry_id] = []
-        hass.data[f"{DOMAIN}_notifications"][config_entry.entry_id].append(notification)
+            # Store notification in hass data for potential UI access
+            notifications[error_reporter.config_entry.entry_id].append(notification)
 
-        _LOGGER.info("Error notification added: %s", notification["title"])
+            _LOGGER.info("Error notification added: %s", notification["title"])
 
     # Register services
     hass.services.async_register(
@@ -333,3 +479,13 @@ async def async_setup_error_reporting_services(hass: HomeAssistant, config_entry
         error_notification_service,
         schema=ERROR_NOTIFICATION_SCHEMA,
     )
+
+async def async_unload_error_reporting_services(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Remove a config entry's reporter and the services once none remain."""
+    _REPORTERS.pop(config_entry.entry_id, None)
+    hass.data.get(ERROR_REPORTS_KEY, {}).pop(config_entry.entry_id, None)
+    hass.data.get(NOTIFICATIONS_KEY, {}).pop(config_entry.entry_id, None)
+
+    if not _REPORTERS:
+        hass.services.async_remove(DOMAIN, "error_report")
+        hass.services.async_remove(DOMAIN, "error_notification")
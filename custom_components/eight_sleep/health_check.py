@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from bisect import bisect_right
 import logging
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
@@ -13,23 +14,29 @@ from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.helpers import config_validation as cv
 import voluptuous as vol
 
-from .const import DOMAIN
-from .util import EightSleepOfflineManager
+from .const import ATTR_CONFIG_ENTRY_ID, DOMAIN
+from .util import CONFIG_ENTRY_SERVICE_SCHEMA
 from .diagnostics import create_diagnostic_report
 
 _LOGGER = logging.getLogger(__name__)
 
+# hass.data key for storing health check results
+HEALTH_RESULTS_KEY = f"{DOMAIN}_health"
+
+# Health checkers by config entry id, shared by the domain-wide services
+_HEALTH_CHECKERS: Dict[str, EightSleepHealthChecker] = {}
+
 # Service schemas
-HEALTH_CHECK_SCHEMA = vol.Schema({
+HEALTH_CHECK_SCHEMA = CONFIG_ENTRY_SERVICE_SCHEMA.extend({
     vol.Optional("detailed", default=False): cv.boolean,
 })
 
-PERFORMANCE_CHECK_SCHEMA = vol.Schema({
+PERFORMANCE_CHECK_SCHEMA = CONFIG_ENTRY_SERVICE_SCHEMA.extend({
     vol.Optional("include_cache", default=True): cv.boolean,
     vol.Optional("include_connection", default=True): cv.boolean,
 })
 
-CACHE_CLEAR_SCHEMA = vol.Schema({
+CACHE_CLEAR_SCHEMA = CONFIG_ENTRY_SERVICE_SCHEMA.extend({
     vol.Optional("confirm", default=False): cv.boolean,
 })
 
@@ -41,6 +48,19 @@ HEALTH_THRESHOLDS = {
     "max_cache_errors": 10,
 }
 
+# Score thresholds and the status label for each band between them
+OVERALL_STATUS_THRESHOLDS = (50, 75, 90)
+OVERALL_STATUS_LABELS = ("poor", "fair", "good", "excellent")
+SECTION_STATUS_THRESHOLDS = (40, 70)
+SECTION_STATUS_LABELS = ("poor", "degraded", "healthy")
+
+# Overall score weights per health check section
+HEALTH_SCORE_WEIGHTS = {
+    "connection_score": 0.5,
+    "cache_score": 0.3,
+    "performance_score": 0.2,
+}
+
 class EightSleepHealthChecker:
     """Health checker for Eight Sleep integration."""
 
@@ -51,48 +71,65 @@ class EightSleepHealthChecker:
         self._last_health_check = None
         self._health_history = []
 
-    async def perform_health_check(self, detailed: bool = False) -> Dict[str, Any]:
-        """Perform a comprehensive health check."""
+    async def perform_health_check(
+        self,
+        detailed: bool = False,
+        include_cache: bool = True,
+        include_connection: bool = True,
+        include_performance: bool = True,
+    ) -> Dict[str, Any]:
+        """Perform a health check of the requested sections.
+
+        Sections that are not included are left out of the report, but still
+        count towards the overall score. ``detailed`` only controls whether
+        full diagnostics are attached.
+        """
         try:
             config_entry_data = self.hass.data[DOMAIN][self.config_entry.entry_id]
             offline_manager = config_entry_data.offline_manager
 
+            # Take one metrics snapshot shared by all section checks
+            health_metrics = offline_manager.get_health_report()
+
             # Basic health metrics
             health_report = {
                 "timestamp": datetime.now().isoformat(),
                 "integration_status": "healthy",
-                "connection_status": "unknown",
-                "cache_status": "unknown",
-                "performance_status": "unknown",
                 "overall_score": 0,
                 "issues": [],
                 "recommendations": [],
             }
 
+            # Every section counts towards the overall score, so it is the
+            # same whichever sections are reported
+            connection_health = self._check_connection_health(health_metrics)
+            cache_health = self._check_cache_health(health_metrics)
+            performance_health = self._check_performance_health(health_metrics)
+
             # Check connection health
-            connection_health = await self._check_connection_health(offline_manager)
-            health_report.update(connection_health)
+            if include_connection:
+                health_report["connection_status"] = "unknown"
+                health_report.update(connection_health)
 
             # Check cache health
-            cache_health = await self._check_cache_health(offline_manager)
-            health_report.update(cache_health)
+            if include_cache:
+                health_report["cache_status"] = "unknown"
+                health_report.update(cache_health)
 
             # Check performance
-            performance_health = await self._check_performance_health(offline_manager)
-            health_report.update(performance_health)
+            if include_performance:
+                health_report["performance_status"] = "unknown"
+                health_report.update(performance_health)
 
             # Calculate overall score
-            health_report["overall_score"] = self._calculate_health_score(health_report)
+            health_report["overall_score"] = self._calculate_health_score(
+                {**connection_health, **cache_health, **performance_health}
+            )
 
             # Determine overall status
-            if health_report["overall_score"] >= 90:
-                health_report["integration_status"] = "excellent"
-            elif health_report["overall_score"] >= 75:
-                health_report["integration_status"] = "good"
-            elif health_report["overall_score"] >= 50:
-                health_report["integration_status"] = "fair"
-            else:
-                health_report["integration_status"] = "poor"
+            health_report["integration_status"] = OVERALL_STATUS_LABELS[
+                bisect_right(OVERALL_STATUS_THRESHOLDS, health_report["overall_score"])
+            ]
 
             # Add detailed diagnostics if requested
             if detailed:
@@ -123,9 +160,8 @@ class EightSleepHealthChecker:
                 "overall_score": 0,
             }
 
-    async def _check_connection_health(self, offline_manager: EightSleepOfflineManager) -> Dict[str, Any]:
+    def _check_connection_health(self, health_metrics: Dict[str, Any]) -> Dict[str, Any]:
         """Check connection health."""
-        health_metrics = offline_manager.get_health_report()
         connection_status = health_metrics["connection_status"]
 
         issues = []
@@ -160,15 +196,14 @@ class EightSleepHealthChecker:
             recommendations.append("Check network connectivity and firewall settings")
 
         return {
-            "connection_status": "healthy" if score >= 70 else "degraded" if score >= 40 else "poor",
+            "connection_status": SECTION_STATUS_LABELS[bisect_right(SECTION_STATUS_THRESHOLDS, score)],
             "connection_score": max(0, score),
             "connection_issues": issues,
             "connection_recommendations": recommendations,
         }
 
-    async def _check_cache_health(self, offline_manager: EightSleepOfflineManager) -> Dict[str, Any]:
+    def _check_cache_health(self, health_metrics: Dict[str, Any]) -> Dict[str, Any]:
         """Check cache health."""
-        health_metrics = offline_manager.get_health_report()
         cache_stats = health_metrics["cache_stats"]
 
         issues = []
@@ -197,15 +232,14 @@ class EightSleepHealthChecker:
             recommendations.append("Integration may not have cached data yet")
 
         return {
-            "cache_status": "healthy" if score >= 70 else "degraded" if score >= 40 else "poor",
+            "cache_status": SECTION_STATUS_LABELS[bisect_right(SECTION_STATUS_THRESHOLDS, score)],
             "cache_score": max(0, score),
             "cache_issues": issues,
             "cache_recommendations": recommendations,
         }
 
-    async def _check_performance_health(self, offline_manager: EightSleepOfflineManager) -> Dict[str, Any]:
+    def _check_performance_health(self, health_metrics: Dict[str, Any]) -> Dict[str, Any]:
         """Check performance health."""
-        health_metrics = offline_manager.get_health_report()
 
         issues = []
         recommendations = []
@@ -225,7 +259,7 @@ class EightSleepHealthChecker:
             recommendations.append("Check API connectivity and service status")
 
         return {
-            "performance_status": "healthy" if score >= 70 else "degraded" if score >= 40 else "poor",
+            "performance_status": SECTION_STATUS_LABELS[bisect_right(SECTION_STATUS_THRESHOLDS, score)],
             "performance_score": max(0, score),
             "performance_issues": issues,
             "performance_recommendations": recommendations,
@@ -233,18 +267,12 @@ class EightSleepHealthChecker:
 
     def _calculate_health_score(self, health_report: Dict[str, Any]) -> int:
         """Calculate overall health score."""
-        scores = [
-            health_report.get("connection_score", 0),
-            health_report.get("cache_score", 0),
-            health_report.get("performance_score", 0),
-        ]
-
-        # Weight the scores (connection is most important)
-        weighted_score = (
-            scores[0] * 0.5 +  # Connection: 50%
-            scores[1] * 0.3 +  # Cache: 30%
-            scores[2] * 0.2    # Performance: 20%
-        )
+        weighted_score = 0.0
+
+        # Weight the scores (connection is most important); a section that
+        # was not checked counts as 0
+        for key, weight in HEALTH_SCORE_WEIGHTS.items():
+            weighted_score += health_report.get(key, 0) * weight
 
         return int(weighted_score)
 
@@ -284,58 +312,73 @@ class EightSleepHealthChecker:
         """Get health check history."""
         return self._health_history.copy()
 
+def _get_target_checkers(call: ServiceCall) -> list[EightSleepHealthChecker]:
+    """Return the health checkers a service call applies to.
+
+    Calls without a config entry id apply to every configured account.
+    """
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    if not entry_id:
+        return list(_HEALTH_CHECKERS.values())
+    if entry_id not in _HEALTH_CHECKERS:
+        _LOGGER.warning("No Eight Sleep health checker for config entry: %s", entry_id)
+        return []
+    return [_HEALTH_CHECKERS[entry_id]]
+
 async def async_setup_health_services(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
-    """Set up health check services."""
+    """Set up health check services.
 
-    health_checker = EightSleepHealthChecker(hass, config_entry)
+    Services are registered once for the domain; each config entry only adds
+    its health checker to the shared registry.
+    """
+
+    _HEALTH_CHECKERS[config_entry.entry_id] = EightSleepHealthChecker(hass, config_entry)
+    health_results = hass.data.setdefault(HEALTH_RESULTS_KEY, {})
+
+    if hass.services.has_service(DOMAIN, "health_check"):
+        return
 
     async def health_check_service(call: ServiceCall) -> None:
         """Service to perform health check."""
         detailed = call.data.get("detailed", False)
-        result = await health_checker.perform_health_check(detailed)
 
-        # Log the result
-        _LOGGER.info("Health check result: %s (Score: %d)",
-                    result["integration_status"],
-                    result["overall_score"])
+        for health_checker in _get_target_checkers(call):
+            result = await health_checker.perform_health_check(detailed)
+
+            # Log the result
+            _LOGGER.info("Health check result: %s (Score: %d)",
+                        result["integration_status"],
+                        result["overall_score"])
 
-        # Store result in hass data for potential UI access
-        hass.data.setdefault(f"{DOMAIN}_health", {})
-        hass.data[f"{DOMAIN}_health"][config_entry.entry_id] = result
+            # Store result in hass data for potential UI access
+            health_results[health_checker.config_entry.entry_id] = result
 
     async def performance_check_service(call: ServiceCall) -> None:
         """Service to perform performance check."""
         include_cache = call.data.get("include_cache", True)
         include_connection = call.data.get("include_connection", True)
 
-        result = await health_checker.perform_health_check(detailed=True)
-
-        # Filter results based on parameters
-        if not include_cache:
-            result.pop("cache_status", None)
-            result.pop("cache_score", None)
-            result.pop("cache_issues", None)
-            result.pop("cache_recommendations", None)
-
-        if not include_connection:
-            result.pop("connection_status", None)
-            result.pop("connection_score", None)
-            result.pop("connection_issues", None)
-            result.pop("connection_recommendations", None)
+        for health_checker in _get_target_checkers(call):
+            result = await health_checker.perform_health_check(
+                detailed=True,
+                include_cache=include_cache,
+                include_connection=include_connection,
+            )
 
-        _LOGGER.info("Performance check completed")
-        hass.data.setdefault(f"{DOMAIN}_health", {})
-        hass.data[f"{DOMAIN}_health"][config_entry.entry_id] = result
+            _LOGGER.info("Performance check completed")
+            health_results[health_checker.config_entry.entry_id] = result
 
     async def clear_cache_service(call: ServiceCall) -> None:
         """Service to clear integration cache."""
         confirm = call.data.get("confirm", False)
-        result = await health_checker.clear_cache(confirm)
 
-        if result["success"]:
-            _LOGGER.info("Cache cleared successfully")
-        else:
-            _LOGGER.warning("Cache clear failed: %s", result["message"])
+        for health_checker in _get_target_checkers(call):
+            result = await health_checker.clear_cache(confirm)
+
+            if result["success"]:
+                _LOGGER.info("Cache cleared successfully")
+            else:
+                _LOGGER.warning("Cache clear failed: %s", result["message"])
 
     # Register services
     hass.services.async_register(
@@ -358,3 +401,13 @@ async def async_setup_health_services(hass: HomeAssistant, config_entry: ConfigE
         clear_cache_service,
         schema=CACHE_CLEAR_SCHEMA,
     )
+
+async def async_unload_health_services(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Remove a config entry's health checker and the services once none remain."""
+    _HEALTH_CHECKERS.pop(config_entry.entry_id, None)
+    hass.data.get(HEALTH_RESULTS_KEY, {}).pop(config_entry.entry_id, None)
+
+    if not _HEALTH_CHECKERS:
+        hass.services.async_remove(DOMAIN, "health_check")
+        hass.services.async_remove(DOMAIN, "performance_check")
+        hass.services.async_remove(DOMAIN, "clear_cache")
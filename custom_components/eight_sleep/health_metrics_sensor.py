@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 import logging
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -31,29 +34,262 @@ from .pyEight.eight import EightSleep
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entity descriptions for each sensor type. HRV has no dedicated device class,
+# so the closest match is used.
+SENSOR_DESCRIPTIONS: Mapping[str, SensorEntityDescription] = MappingProxyType({
+    description.key: description
+    for description in (
+        SensorEntityDescription(
+            key="current_hrv",
+            name="HRV (Current)",
+            device_class=SensorDeviceClass.VOLTAGE,
+            native_unit_of_measurement="ms",
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="current_heart_rate",
+            name="Heart Rate (Current)",
+            device_class=SensorDeviceClass.FREQUENCY,
+            native_unit_of_measurement="bpm",
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="current_respiratory_rate",
+            name="Respiratory Rate (Current)",
+            device_class=SensorDeviceClass.FREQUENCY,
+            native_unit_of_measurement="breaths/min",
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="current_breath_rate",
+            name="Breathing Rate (Current)",
+            device_class=SensorDeviceClass.FREQUENCY,
+            native_unit_of_measurement="breaths/min",
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="last_hrv",
+            name="HRV (Last Session)",
+            device_class=SensorDeviceClass.VOLTAGE,
+            native_unit_of_measurement="ms",
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="last_heart_rate",
+            name="Heart Rate (Last Session)",
+            device_class=SensorDeviceClass.FREQUENCY,
+            native_unit_of_measurement="bpm",
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="last_respiratory_rate",
+            name="Respiratory Rate (Last Session)",
+            device_class=SensorDeviceClass.FREQUENCY,
+            native_unit_of_measurement="breaths/min",
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="last_breath_rate",
+            name="Breathing Rate (Last Session)",
+            device_class=SensorDeviceClass.FREQUENCY,
+            native_unit_of_measurement="breaths/min",
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="hrv_score",
+            name="HRV Score",
+            device_class=SensorDeviceClass.VOLTAGE,
+            native_unit_of_measurement="ms",
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="heart_rate_score",
+            name="Heart Rate Score",
+            device_class=SensorDeviceClass.FREQUENCY,
+            native_unit_of_measurement="bpm",
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="respiratory_rate_score",
+            name="Respiratory Rate Score",
+            device_class=SensorDeviceClass.FREQUENCY,
+            native_unit_of_measurement="breaths/min",
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="health_insight",
+            name="Health Insight",
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="hrv_algorithm_version",
+            name="HRV Algorithm Version",
+            device_class=SensorDeviceClass.VOLTAGE,
+            native_unit_of_measurement="ms",
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="mean_respiratory_rate",
+            name="Mean Respiratory Rate",
+            device_class=SensorDeviceClass.FREQUENCY,
+            native_unit_of_measurement="breaths/min",
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="current_hrv_trend",
+            name="HRV Trend",
+            device_class=SensorDeviceClass.VOLTAGE,
+            native_unit_of_measurement="ms",
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="heart_rate_variability",
+            name="Heart Rate Variability",
+            device_class=SensorDeviceClass.FREQUENCY,
+            native_unit_of_measurement="bpm",
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="respiratory_rate_trend",
+            name="Respiratory Rate Trend",
+            device_class=SensorDeviceClass.FREQUENCY,
+            native_unit_of_measurement="breaths/min",
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="breathing_quality_score",
+            name="Breathing Quality Score",
+            device_class=SensorDeviceClass.FREQUENCY,
+            native_unit_of_measurement="breaths/min",
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="cardiovascular_fitness_score",
+            name="Cardiovascular Fitness Score",
+            native_unit_of_measurement=PERCENTAGE,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="recovery_score",
+            name="Recovery Score",
+            native_unit_of_measurement=PERCENTAGE,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+    )
+})
+
 # Health Metrics Sensor Types
-HEALTH_METRICS_SENSORS = [
-    "current_hrv",
-    "current_heart_rate", 
-    "current_respiratory_rate",
-    "current_breath_rate",
-    "last_hrv",
-    "last_heart_rate",
-    "last_respiratory_rate",
-    "last_breath_rate",
-    "hrv_score",
-    "heart_rate_score",
-    "respiratory_rate_score",
-    "health_insight",
-    "hrv_algorithm_version",
-    "mean_respiratory_rate",
-    "current_hrv_trend",
-    "heart_rate_variability",
-    "respiratory_rate_trend",
-    "breathing_quality_score",
-    "cardiovascular_fitness_score",
-    "recovery_score",
-]
+HEALTH_METRICS_SENSORS = tuple(SENSOR_DESCRIPTIONS)
+
+# Attribute category for each sensor type
+_CATEGORY = {
+    "current_hrv": "hrv",
+    "last_hrv": "hrv",
+    "hrv_score": "hrv",
+    "hrv_algorithm_version": "hrv",
+    "current_hrv_trend": "hrv",
+    "current_heart_rate": "heart_rate",
+    "last_heart_rate": "heart_rate",
+    "heart_rate_score": "heart_rate",
+    "heart_rate_variability": "heart_rate",
+    "current_respiratory_rate": "respiratory",
+    "current_breath_rate": "respiratory",
+    "last_respiratory_rate": "respiratory",
+    "last_breath_rate": "respiratory",
+    "respiratory_rate_score": "respiratory",
+    "mean_respiratory_rate": "respiratory",
+    "respiratory_rate_trend": "respiratory",
+    "breathing_quality_score": "respiratory",
+    "health_insight": "other",
+    "cardiovascular_fitness_score": "other",
+    "recovery_score": "other",
+}
+
+# Sensor types whose value does not come from the trends data
+_NO_TREND_KEYS = frozenset(
+    {
+        "current_hrv",
+        "current_heart_rate",
+        "current_respiratory_rate",
+        "current_breath_rate",
+        "last_hrv",
+        "last_heart_rate",
+        "last_respiratory_rate",
+        "last_breath_rate",
+        "health_insight",
+    }
+)
+
+
+def _no_value(user: EightUser, latest: dict[str, Any] | None, sqs: dict[str, Any]) -> None:
+    """Value getter for unknown sensor types."""
+    return None
+
+
+def _sqs_field(metric: str, field: str):
+    """Return a value getter for one field of a sleepQualityScore metric."""
+
+    def getter(user: EightUser, latest: dict[str, Any] | None, sqs: dict[str, Any]) -> Any:
+        return (sqs.get(metric) or {}).get(field)
+
+    return getter
+
+
+_hrv_score = _sqs_field("hrv", "score")
+_hrv_current = _sqs_field("hrv", "current")
+_heart_rate_score = _sqs_field("heartRate", "score")
+_respiratory_rate_score = _sqs_field("respiratoryRate", "score")
+_respiratory_rate_current = _sqs_field("respiratoryRate", "current")
+_mean_respiratory_rate = _sqs_field("respiratoryRate", "average")
+
+
+def _health_insight(user: EightUser, latest: dict[str, Any] | None, sqs: dict[str, Any]) -> str | None:
+    """Get health insight from user profile."""
+    profile = user.user_profile
+    return (profile.get("notifications") or {}).get("healthInsight") if profile else None
+
+
+def _hrv_algorithm_version(user: EightUser, latest: dict[str, Any] | None, sqs: dict[str, Any]) -> str | None:
+    """Get HRV algorithm version from the latest trend's sessions."""
+    sessions = latest.get("sessions") if latest is not None else None
+    return sessions[-1].get("hrvAlgorithmVersion") if sessions else None
+
+
+def _recovery_score(user: EightUser, latest: dict[str, Any] | None, sqs: dict[str, Any]) -> int | None:
+    """Get recovery score based on HRV and other metrics."""
+    if latest is None:
+        return None
+    hrv_score = (sqs.get("hrv") or {}).get("score", 0)
+    heart_rate_score = (sqs.get("heartRate") or {}).get("score", 0)
+    # Calculate recovery score as average of HRV and heart rate scores
+    return (hrv_score + heart_rate_score) // 2
+
+
+# Value getter for each sensor type, called as getter(user, latest, sqs)
+# where sqs is the latest trend's sleepQualityScore. Types that report the
+# same reading share one getter.
+_VALUE_DISPATCH = {
+    "current_hrv": lambda user, latest, sqs: user.current_hrv,
+    "current_heart_rate": lambda user, latest, sqs: user.current_heart_rate,
+    "current_respiratory_rate": lambda user, latest, sqs: user.current_resp_rate,
+    "current_breath_rate": lambda user, latest, sqs: user.current_breath_rate,
+    "last_hrv": lambda user, latest, sqs: user.last_hrv,
+    "last_heart_rate": lambda user, latest, sqs: user.last_heart_rate,
+    "last_respiratory_rate": lambda user, latest, sqs: user.last_resp_rate,
+    "last_breath_rate": lambda user, latest, sqs: user.last_breath_rate,
+    "hrv_score": _hrv_score,
+    "heart_rate_score": _heart_rate_score,
+    "respiratory_rate_score": _respiratory_rate_score,
+    "health_insight": _health_insight,
+    "hrv_algorithm_version": _hrv_algorithm_version,
+    "mean_respiratory_rate": _mean_respiratory_rate,
+    "current_hrv_trend": _hrv_current,
+    "heart_rate_variability": _hrv_current,
+    "respiratory_rate_trend": _respiratory_rate_current,
+    "breathing_quality_score": _respiratory_rate_score,
+    "cardiovascular_fitness_score": _heart_rate_score,
+    "recovery_score": _recovery_score,
+}
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -63,22 +299,16 @@ async def async_setup_entry(
     coordinator = config_data.coordinator
     eight = config_data.eight
 
-    entities = []
-
-    # Add health metrics sensors for each user
-    for user in eight.users.values():
-        for sensor_type in HEALTH_METRICS_SENSORS:
-            entities.append(
-                EightHealthMetricsSensor(
-                    entry,
-                    coordinator,
-                    eight,
-                    user,
-                    sensor_type,
-                )
-            )
-
-    async_add_entities(entities)
+    # Add health metrics sensors for each user. The coordinator has already
+    # fetched the data, so the entities need no update of their own.
+    async_add_entities(
+        (
+            EightHealthMetricsSensor(entry, coordinator, eight, user, sensor_type)
+            for user in eight.users.values()
+            for sensor_type in HEALTH_METRICS_SENSORS
+        ),
+        update_before_add=False,
+    )
 
 
 class EightHealthMetricsSensor(EightSleepBaseEntity, SensorEntity):
@@ -95,261 +325,121 @@ class EightHealthMetricsSensor(EightSleepBaseEntity, SensorEntity):
         """Initialize the health metrics sensor."""
         super().__init__(entry, coordinator, eight, user)
         self._sensor_type = sensor_type
-        self._attr_name = f"{self._user.side} {self._get_sensor_name(sensor_type)}"
-        self._attr_unique_id = f"{self._user.user_id}_{sensor_type}"
-        
-        # Set device class and unit based on sensor type
-        self._set_sensor_properties(sensor_type)
-
-    def _get_sensor_name(self, sensor_type: str) -> str:
-        """Get the display name for the sensor type."""
-        name_map = {
-            "current_hrv": "HRV (Current)",
-            "current_heart_rate": "Heart Rate (Current)",
-            "current_respiratory_rate": "Respiratory Rate (Current)",
-            "current_breath_rate": "Breathing Rate (Current)",
-            "last_hrv": "HRV (Last Session)",
-            "last_heart_rate": "Heart Rate (Last Session)",
-            "last_respiratory_rate": "Respiratory Rate (Last Session)",
-            "last_breath_rate": "Breathing Rate (Last Session)",
-            "hrv_score": "HRV Score",
-            "heart_rate_score": "Heart Rate Score",
-            "respiratory_rate_score": "Respiratory Rate Score",
-            "health_insight": "Health Insight",
-            "hrv_algorithm_version": "HRV Algorithm Version",
-            "mean_respiratory_rate": "Mean Respiratory Rate",
-            "current_hrv_trend": "HRV Trend",
-            "heart_rate_variability": "Heart Rate Variability",
-            "respiratory_rate_trend": "Respiratory Rate Trend",
-            "breathing_quality_score": "Breathing Quality Score",
-            "cardiovascular_fitness_score": "Cardiovascular Fitness Score",
-            "recovery_score": "Recovery Score",
-        }
-        return name_map.get(sensor_type, sensor_type.replace("_", " ").title())
-
-    def _set_sensor_properties(self, sensor_type: str) -> None:
-        """Set device class, unit, and state class based on sensor type."""
-        if "hrv" in sensor_type.lower():
-            self._attr_device_class = SensorDeviceClass.VOLTAGE  # Closest match for HRV
-            self._attr_native_unit_of_measurement = "ms"  # Milliseconds for HRV
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-        elif "heart_rate" in sensor_type.lower():
-            self._attr_device_class = SensorDeviceClass.FREQUENCY
-            self._attr_native_unit_of_measurement = "bpm"  # Beats per minute
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-        elif "respiratory" in sensor_type.lower() or "breath" in sensor_type.lower():
-            self._attr_device_class = SensorDeviceClass.FREQUENCY
-            self._attr_native_unit_of_measurement = "breaths/min"
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-        elif "score" in sensor_type.lower():
-            self._attr_device_class = None
-            self._attr_native_unit_of_measurement = PERCENTAGE
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-        else:
-            self._attr_device_class = None
-            self._attr_native_unit_of_measurement = None
-            self._attr_state_class = SensorStateClass.MEASUREMENT
+        # The sensor type never changes, so look up its value getter once
+        self._get_value = _VALUE_DISPATCH.get(sensor_type, _no_value)
+        self._attribute_builder = _ATTRIBUTE_BUILDERS.get(_CATEGORY.get(sensor_type, "other"))
+        self._needs_trends = sensor_type not in _NO_TREND_KEYS
+        self._value_source: dict[str, Any] | None = None
+        self._value_cache: str | int | float | None = None
+        self._attrs_source: dict[str, Any] | None = None
+        self._attrs_cache: Mapping[str, Any] | None = None
+        self._last_error: str | None = None
+        self.entity_description = SENSOR_DESCRIPTIONS.get(sensor_type) or SensorEntityDescription(
+            key=sensor_type,
+            name=sensor_type.replace("_", " ").title(),
+            state_class=SensorStateClass.MEASUREMENT,
+        )
+        self._attr_name = f"{self._user.side} {self.entity_description.name}"
+        self._attr_unique_id = f"{self._user.user_id}_{self.entity_description.key}"
+        self._base_attrs: Mapping[str, Any] = MappingProxyType(
+            {
+                "side": self._user.side,
+                "user_id": self._user.user_id,
+                "sensor_type": sensor_type,
+            }
+        )
 
     @property
     def native_value(self) -> str | int | float | None:
         """Return the state of the sensor."""
-        if not self._user:
-            return None
-
+        user = self._user
         try:
-            if self._sensor_type == "current_hrv":
-                return self._user.current_hrv
-            elif self._sensor_type == "current_heart_rate":
-                return self._user.current_heart_rate
-            elif self._sensor_type == "current_respiratory_rate":
-                return self._user.current_resp_rate
-            elif self._sensor_type == "current_breath_rate":
-                return self._user.current_breath_rate
-            elif self._sensor_type == "last_hrv":
-                return self._user.last_hrv
-            elif self._sensor_type == "last_heart_rate":
-                return self._user.last_heart_rate
-            elif self._sensor_type == "last_respiratory_rate":
-                return self._user.last_resp_rate
-            elif self._sensor_type == "last_breath_rate":
-                return self._user.last_breath_rate
-            elif self._sensor_type == "hrv_score":
-                return self._get_hrv_score()
-            elif self._sensor_type == "heart_rate_score":
-                return self._get_heart_rate_score()
-            elif self._sensor_type == "respiratory_rate_score":
-                return self._get_respiratory_rate_score()
-            elif self._sensor_type == "health_insight":
-                return self._get_health_insight()
-            elif self._sensor_type == "hrv_algorithm_version":
-                return self._get_hrv_algorithm_version()
-            elif self._sensor_type == "mean_respiratory_rate":
-                return self._get_mean_respiratory_rate()
-            elif self._sensor_type == "current_hrv_trend":
-                return self._get_current_hrv_trend()
-            elif self._sensor_type == "heart_rate_variability":
-                return self._get_heart_rate_variability()
-            elif self._sensor_type == "respiratory_rate_trend":
-                return self._get_respiratory_rate_trend()
-            elif self._sensor_type == "breathing_quality_score":
-                return self._get_breathing_quality_score()
-            elif self._sensor_type == "cardiovascular_fitness_score":
-                return self._get_cardiovascular_fitness_score()
-            elif self._sensor_type == "recovery_score":
-                return self._get_recovery_score()
-            else:
+            trends = user.trends
+            if trends:
+                latest = trends[-1]
+                # Trend-backed values, including derived ones like the
+                # recovery score, are computed once per trend
+                if self._needs_trends and latest is self._value_source:
+                    return self._value_cache
+                sqs = latest.get("sleepQualityScore") or {}
+            elif self._needs_trends:
+                # Common at startup and while offline; nothing to look up
                 return None
-        except Exception as e:
-            _LOGGER.error(f"Error getting {self._sensor_type} value: {e}")
+            else:
+                latest = None
+                sqs = {}
+            value = self._get_value(user, latest, sqs)
+        except Exception as err:
+            # Log each distinct failure once; repeats on later refreshes go to debug
+            message = str(err)
+            if message != self._last_error:
+                self._last_error = message
+                _LOGGER.error("Error getting %s value: %s", self._sensor_type, message)
+            else:
+                _LOGGER.debug("Error getting %s value: %s", self._sensor_type, message)
             return None
+        self._last_error = None
+        if self._needs_trends:
+            self._value_source = latest
+            self._value_cache = value
+        return value
 
-    def _get_hrv_score(self) -> int | None:
-        """Get HRV score from sleep quality data."""
-        try:
-            if self._user.trends and len(self._user.trends) > 0:
-                current_trend = self._user.trends[-1]
-                return current_trend.get("sleepQualityScore", {}).get("hrv", {}).get("score")
-        except Exception as e:
-            _LOGGER.error(f"Error getting HRV score: {e}")
-        return None
-
-    def _get_heart_rate_score(self) -> int | None:
-        """Get heart rate score from sleep quality data."""
-        try:
-            if self._user.trends and len(self._user.trends) > 0:
-                current_trend = self._user.trends[-1]
-                return current_trend.get("sleepQualityScore", {}).get("heartRate", {}).get("score")
-        except Exception as e:
-            _LOGGER.error(f"Error getting heart rate score: {e}")
-        return None
-
-    def _get_respiratory_rate_score(self) -> int | None:
-        """Get respiratory rate score from sleep quality data."""
-        try:
-            if self._user.trends and len(self._user.trends) > 0:
-                current_trend = self._user.trends[-1]
-                return current_trend.get("sleepQualityScore", {}).get("respiratoryRate", {}).get("score")
-        except Exception as e:
-            _LOGGER.error(f"Error getting respiratory rate score: {e}")
-        return None
-
-    def _get_health_insight(self) -> str | None:
-        """Get health insight from user profile."""
-        try:
-            if self._user.user_profile:
-                notifications = self._user.user_profile.get("notifications", {})
-                return notifications.get("healthInsight")
-        except Exception as e:
-            _LOGGER.error(f"Error getting health insight: {e}")
-        return None
-
-    def _get_hrv_algorithm_version(self) -> str | None:
-        """Get HRV algorithm version from trends data."""
-        try:
-            if self._user.trends and len(self._user.trends) > 0:
-                current_trend = self._user.trends[-1]
-                sessions = current_trend.get("sessions", [])
-                if sessions:
-                    return sessions[-1].get("hrvAlgorithmVersion")
-        except Exception as e:
-            _LOGGER.error(f"Error getting HRV algorithm version: {e}")
-        return None
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any]:
+        """Return entity specific state attributes.
+
+        The side, user and sensor type never change, so sensors without
+        health-specific attributes always return the same read-only mapping.
+        The rest only change with the latest trend and are cached until a new
+        trend arrives.
+        """
+        attribute_builder = self._attribute_builder
+        if attribute_builder is None:
+            return self._base_attrs
+
+        user = self._user
+        trends = user.trends
+        latest = trends[-1] if trends else None
+        if self._attrs_cache is not None and latest is self._attrs_source:
+            return self._attrs_cache
 
-    def _get_mean_respiratory_rate(self) -> float | None:
-        """Get mean respiratory rate from trends data."""
-        try:
-            if self._user.trends and len(self._user.trends) > 0:
-                current_trend = self._user.trends[-1]
-                return current_trend.get("sleepQualityScore", {}).get("respiratoryRate", {}).get("average")
-        except Exception as e:
-            _LOGGER.error(f"Error getting mean respiratory rate: {e}")
-        return None
+        # Add health-specific attributes
+        sqs = (latest.get("sleepQualityScore") or {}) if latest is not None else {}
+        attrs = {**self._base_attrs, **attribute_builder(user, latest, sqs)}
 
-    def _get_current_hrv_trend(self) -> float | None:
-        """Get current HRV trend value."""
-        try:
-            if self._user.trends and len(self._user.trends) > 0:
-                current_trend = self._user.trends[-1]
-                return current_trend.get("sleepQualityScore", {}).get("hrv", {}).get("current")
-        except Exception as e:
-            _LOGGER.error(f"Error getting current HRV trend: {e}")
-        return None
+        self._attrs_source = latest
+        self._attrs_cache = MappingProxyType(attrs)
+        return self._attrs_cache
 
-    def _get_heart_rate_variability(self) -> float | None:
-        """Get heart rate variability value."""
-        try:
-            if self._user.trends and len(self._user.trends) > 0:
-                current_trend = self._user.trends[-1]
-                return current_trend.get("sleepQualityScore", {}).get("hrv", {}).get("current")
-        except Exception as e:
-            _LOGGER.error(f"Error getting heart rate variability: {e}")
-        return None
 
-    def _get_respiratory_rate_trend(self) -> float | None:
-        """Get respiratory rate trend value."""
-        try:
-            if self._user.trends and len(self._user.trends) > 0:
-                current_trend = self._user.trends[-1]
-                return current_trend.get("sleepQualityScore", {}).get("respiratoryRate", {}).get("current")
-        except Exception as e:
-            _LOGGER.error(f"Error getting respiratory rate trend: {e}")
-        return None
+def _hrv_attributes(user: EightUser, latest: dict[str, Any] | None, sqs: dict[str, Any]) -> dict[str, Any]:
+    """Extra attributes for HRV sensors."""
+    return {
+        "hrv_algorithm_version": _hrv_algorithm_version(user, latest, sqs),
+        "hrv_trend": _hrv_current(user, latest, sqs),
+    }
 
-    def _get_breathing_quality_score(self) -> int | None:
-        """Get breathing quality score."""
-        try:
-            if self._user.trends and len(self._user.trends) > 0:
-                current_trend = self._user.trends[-1]
-                return current_trend.get("sleepQualityScore", {}).get("respiratoryRate", {}).get("score")
-        except Exception as e:
-            _LOGGER.error(f"Error getting breathing quality score: {e}")
-        return None
 
-    def _get_cardiovascular_fitness_score(self) -> int | None:
-        """Get cardiovascular fitness score."""
-        try:
-            if self._user.trends and len(self._user.trends) > 0:
-                current_trend = self._user.trends[-1]
-                return current_trend.get("sleepQualityScore", {}).get("heartRate", {}).get("score")
-        except Exception as e:
-            _LOGGER.error(f"Error getting cardiovascular fitness score: {e}")
-        return None
+def _heart_rate_attributes(user: EightUser, latest: dict[str, Any] | None, sqs: dict[str, Any]) -> dict[str, Any]:
+    """Extra attributes for heart rate sensors."""
+    return {
+        "heart_rate_variability": _hrv_current(user, latest, sqs),
+        "cardiovascular_fitness_score": _heart_rate_score(user, latest, sqs),
+    }
 
-    def _get_recovery_score(self) -> int | None:
-        """Get recovery score based on HRV and other metrics."""
-        try:
-            if self._user.trends and len(self._user.trends) > 0:
-                current_trend = self._user.trends[-1]
-                hrv_score = current_trend.get("sleepQualityScore", {}).get("hrv", {}).get("score", 0)
-                heart_rate_score = current_trend.get("sleepQualityScore", {}).get("heartRate", {}).get("score", 0)
-                # Calculate recovery score as average of HRV and heart rate scores
-                return (hrv_score + heart_rate_score) // 2
-        except Exception as e:
-            _LOGGER.error(f"Error getting recovery score: {e}")
-        return None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return entity specific state attributes."""
-        if not self._user:
-            return None
+def _respiratory_attributes(user: EightUser, latest: dict[str, Any] | None, sqs: dict[str, Any]) -> dict[str, Any]:
+    """Extra attributes for respiratory and breathing sensors."""
+    return {
+        "mean_respiratory_rate": _mean_respiratory_rate(user, latest, sqs),
+        "breathing_quality_score": _respiratory_rate_score(user, latest, sqs),
+        "respiratory_rate_trend": _respiratory_rate_current(user, latest, sqs),
+    }
 
-        attrs = {
-            "side": self._user.side,
-            "user_id": self._user.user_id,
-            "sensor_type": self._sensor_type,
-        }
 
-        # Add health-specific attributes
-        if "hrv" in self._sensor_type.lower():
-            attrs["hrv_algorithm_version"] = self._get_hrv_algorithm_version()
-            attrs["hrv_trend"] = self._get_current_hrv_trend()
-        elif "heart_rate" in self._sensor_type.lower():
-            attrs["heart_rate_variability"] = self._get_heart_rate_variability()
-            attrs["cardiovascular_fitness_score"] = self._get_cardiovascular_fitness_score()
-        elif "respiratory" in self._sensor_type.lower() or "breath" in self._sensor_type.lower():
-            attrs["mean_respiratory_rate"] = self._get_mean_respiratory_rate()
-            attrs["breathing_quality_score"] = self._get_breathing_quality_score()
-            attrs["respiratory_rate_trend"] = self._get_respiratory_rate_trend()
-
-        return attrs 
\ No newline at end of file
+# Extra attribute builder for each sensor category
+_ATTRIBUTE_BUILDERS = {
+    "hrv": _hrv_attributes,
+    "heart_rate": _heart_rate_attributes,
+    "respiratory": _respiratory_attributes,
+}
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections.abc import Callable, Mapping
 import logging
 from datetime import datetime, timedelta
+from itertools import chain
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -16,7 +23,7 @@ from homeassistant.const import (
     PERCENTAGE,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
@@ -28,90 +35,318 @@ from .pyEight.user import EightUser
 _LOGGER = logging.getLogger(__name__)
 
 # Heart rate variability sensor types
-HRV_SENSORS = {
-    "current_hrv": {
-        "name": "Current Heart Rate Variability",
-        "unit": "ms",
-        "device_class": None,
-        "icon": "mdi:heart-pulse",
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    "average_hrv": {
-        "name": "Average Heart Rate Variability",
-        "unit": "ms",
-        "device_class": None,
-        "icon": "mdi:heart-pulse",
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    "hrv_trend": {
-        "name": "Heart Rate Variability Trend",
-        "unit": "ms",
-        "device_class": None,
-        "icon": "mdi:trending-up",
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    "hrv_quality": {
-        "name": "Heart Rate Variability Quality",
-        "unit": None,
-        "device_class": SensorDeviceClass.ENUM,
-        "icon": "mdi:heart-check",
-        "state_class": None,
-    },
-    "hrv_stability": {
-        "name": "Heart Rate Variability Stability",
-        "unit": PERCENTAGE,
-        "device_class": SensorDeviceClass.ENUM,
-        "icon": "mdi:heart-stable",
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    "hrv_recovery": {
-        "name": "Heart Rate Variability Recovery",
-        "unit": None,
-        "device_class": SensorDeviceClass.ENUM,
-        "icon": "mdi:heart-plus",
-        "state_class": None,
-    },
-    "hrv_stress_index": {
-        "name": "Heart Rate Variability Stress Index",
-        "unit": None,
-        "device_class": None,
-        "icon": "mdi:heart-alert",
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    "hrv_balance": {
-        "name": "Heart Rate Variability Balance",
-        "unit": None,
-        "device_class": SensorDeviceClass.ENUM,
-        "icon": "mdi:heart-balance",
-        "state_class": None,
-    },
-}
+HRV_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
+        key="current_hrv",
+        name="Current Heart Rate Variability",
+        native_unit_of_measurement="ms",
+        icon="mdi:heart-pulse",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+    ),
+    SensorEntityDescription(
+        key="average_hrv",
+        name="Average Heart Rate Variability",
+        native_unit_of_measurement="ms",
+        icon="mdi:heart-pulse",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+    ),
+    SensorEntityDescription(
+        key="hrv_trend",
+        name="Heart Rate Variability Trend",
+        native_unit_of_measurement="ms",
+        icon="mdi:trending-up",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+    ),
+    SensorEntityDescription(
+        key="hrv_quality",
+        name="Heart Rate Variability Quality",
+        device_class=SensorDeviceClass.ENUM,
+        icon="mdi:heart-check",
+    ),
+    SensorEntityDescription(
+        key="hrv_stability",
+        name="Heart Rate Variability Stability",
+        native_unit_of_measurement=PERCENTAGE,
+        icon="mdi:heart-stable",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+    ),
+    SensorEntityDescription(
+        key="hrv_recovery",
+        name="Heart Rate Variability Recovery",
+        device_class=SensorDeviceClass.ENUM,
+        icon="mdi:heart-plus",
+    ),
+    SensorEntityDescription(
+        key="hrv_stress_index",
+        name="Heart Rate Variability Stress Index",
+        device_class=SensorDeviceClass.ENUM,
+        icon="mdi:heart-alert",
+    ),
+    SensorEntityDescription(
+        key="hrv_balance",
+        name="Heart Rate Variability Balance",
+        device_class=SensorDeviceClass.ENUM,
+        icon="mdi:heart-balance",
+    ),
+)
 
 # HRV quality categories
-HRV_QUALITY_CATEGORIES = {
+HRV_QUALITY_CATEGORIES = MappingProxyType({
     "excellent": {"min": 100, "max": 200, "description": "Excellent (> 100ms)"},
     "good": {"min": 70, "max": 99, "description": "Good (70-99ms)"},
     "fair": {"min": 50, "max": 69, "description": "Fair (50-69ms)"},
     "poor": {"min": 30, "max": 49, "description": "Poor (30-49ms)"},
     "very_poor": {"min": 0, "max": 29, "description": "Very Poor (< 30ms)"},
-}
+})
 
 # HRV stress index categories
-HRV_STRESS_CATEGORIES = {
+HRV_STRESS_CATEGORIES = MappingProxyType({
     "low": {"min": 0, "max": 30, "description": "Low Stress"},
     "moderate": {"min": 31, "max": 60, "description": "Moderate Stress"},
     "high": {"min": 61, "max": 80, "description": "High Stress"},
     "very_high": {"min": 81, "max": 100, "description": "Very High Stress"},
-}
+})
 
 # HRV recovery categories
-HRV_RECOVERY_CATEGORIES = {
+HRV_RECOVERY_CATEGORIES = MappingProxyType({
     "excellent": {"min": 80, "max": 100, "description": "Excellent Recovery"},
     "good": {"min": 60, "max": 79, "description": "Good Recovery"},
     "fair": {"min": 40, "max": 59, "description": "Fair Recovery"},
     "poor": {"min": 20, "max": 39, "description": "Poor Recovery"},
     "very_poor": {"min": 0, "max": 19, "description": "Very Poor Recovery"},
-}
+})
+
+def _category_bounds(
+    categories: Mapping[str, dict[str, Any]],
+) -> tuple[tuple[float, ...], tuple[float, ...], tuple[str, ...]]:
+    """Return the (mins, maxes, descriptions) of a category table, sorted by min."""
+    ordered = sorted(categories.values(), key=itemgetter("min"))
+    return (
+        tuple(config["min"] for config in ordered),
+        tuple(config["max"] for config in ordered),
+        tuple(config["description"] for config in ordered),
+    )
+
+_QUALITY_BOUNDS = _category_bounds(HRV_QUALITY_CATEGORIES)
+_STRESS_BOUNDS = _category_bounds(HRV_STRESS_CATEGORIES)
+_RECOVERY_BOUNDS = _category_bounds(HRV_RECOVERY_CATEGORIES)
+
+def _lookup_category(
+    value: float, bounds: tuple[tuple[float, ...], tuple[float, ...], tuple[str, ...]]
+) -> str:
+    """Return the description of the category range containing value.
+
+    The ranges are disjoint but not contiguous, so a value that falls in a
+    gap between them is "Unknown".
+    """
+    mins, maxes, descriptions = bounds
+    index = bisect_right(mins, value) - 1
+    if index >= 0 and value <= maxes[index]:
+        return descriptions[index]
+    return "Unknown"
+
+def _get_hrv_quality_category(quality: float) -> str:
+    """Get HRV quality category."""
+    return _lookup_category(quality, _QUALITY_BOUNDS)
+
+def _get_hrv_recovery_category(recovery: float) -> str:
+    """Get HRV recovery category."""
+    return _lookup_category(recovery, _RECOVERY_BOUNDS)
+
+def _get_hrv_stress_category(stress: float) -> str:
+    """Get HRV stress category."""
+    return _lookup_category(stress, _STRESS_BOUNDS)
+
+# Thresholds stepping an HRV value or recovery score up the shared score ladder
+_QUALITY_SCORE_THRESHOLDS = (30, 50, 70, 100)
+_RECOVERY_SCORE_THRESHOLDS = (20, 40, 60, 80)
+_LADDER_SCORES = (25.0, 50.0, 70.0, 85.0, 100.0)
+
+# Placeholder HRV consistency and variance until they are derived from
+# HRV over time
+_HRV_CONSISTENCY_DEFAULT = 85.0
+_HRV_VARIANCE_DEFAULT = 8.5
+
+def _calc_hrv_quality(hrv_value: float) -> float:
+    """Calculate HRV quality score."""
+    try:
+        return _LADDER_SCORES[bisect_right(_QUALITY_SCORE_THRESHOLDS, hrv_value)]
+    except Exception:
+        return 0.0
+
+def _calc_hrv_recovery(hrv_data: dict) -> float:
+    """Calculate HRV recovery score."""
+    try:
+        # This would analyze HRV recovery patterns
+        # For now, use a simplified calculation
+        recovery_score = hrv_data.get("recovery", 0)
+        return _LADDER_SCORES[bisect_right(_RECOVERY_SCORE_THRESHOLDS, recovery_score)]
+    except Exception:
+        return 0.0
+
+def _calc_hrv_stability(hrv_data: dict) -> float:
+    """Calculate HRV stability percentage."""
+    try:
+        # This would typically analyze HRV variance over time
+        # For now, use a simplified calculation
+        variance = hrv_data.get("variance", 0)
+
+        if variance <= 5:
+            return 100.0
+        elif variance <= 10:
+            return 85.0
+        elif variance <= 15:
+            return 70.0
+        elif variance <= 20:
+            return 50.0
+        else:
+            return 30.0
+    except Exception:
+        return 0.0
+
+def _calc_hrv_stress_index(hrv_data: dict) -> float:
+    """Calculate HRV stress index."""
+    try:
+        # This would analyze HRV patterns to determine stress
+        # For now, use a simplified calculation
+        stress_score = hrv_data.get("stress", 0)
+
+        return 0.0 if stress_score <= 0 else 100.0 if stress_score >= 100 else stress_score
+    except Exception:
+        return 0.0
+
+def _calc_hrv_balance(hrv_data: dict) -> float:
+    """Calculate HRV balance score."""
+    try:
+        # This would analyze HRV balance between sympathetic and parasympathetic
+        # For now, use a simplified calculation
+        balance_score = hrv_data.get("balance", 0)
+
+        return 0.0 if balance_score <= 0 else 100.0 if balance_score >= 100 else balance_score
+    except Exception:
+        return 0.0
+
+def _get_hrv_category(hrv_value: float) -> str:
+    """Get HRV category."""
+    if hrv_value >= 100:
+        return "Excellent"
+    elif hrv_value >= 70:
+        return "Good"
+    elif hrv_value >= 50:
+        return "Fair"
+    elif hrv_value >= 30:
+        return "Poor"
+    else:
+        return "Very Poor"
+
+def _as_float(value: Any, default: float) -> float:
+    """Return value as a float, or default if it is missing or not numeric."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+def _extract_hrv_data(session: dict) -> dict | None:
+    """Extract HRV data from a sleep session."""
+    try:
+        # Extract HRV metrics from session data
+        hrv_data = session.get("hrv", {})
+
+        # Coerced once here, so the numeric sensors can report them as-is
+        current_hrv = _as_float(hrv_data.get("current"), 0.0)
+        average_hrv = _as_float(hrv_data.get("average"), 0.0)
+        hrv_trend = _as_float(hrv_data.get("trend"), 0.0)
+        hrv_quality = _calc_hrv_quality(current_hrv)
+        hrv_stability = _calc_hrv_stability(hrv_data)
+        hrv_recovery = _calc_hrv_recovery(hrv_data)
+        hrv_stress_index = _calc_hrv_stress_index(hrv_data)
+        hrv_balance = _calc_hrv_balance(hrv_data)
+
+        return {
+            "current_hrv": current_hrv,
+            "average_hrv": average_hrv,
+            "hrv_trend": hrv_trend,
+            "hrv_quality": hrv_quality,
+            "hrv_stability": hrv_stability,
+            "hrv_recovery": hrv_recovery,
+            "hrv_stress_index": hrv_stress_index,
+            "hrv_balance": hrv_balance,
+            "hrv_consistency": _HRV_CONSISTENCY_DEFAULT,
+            "hrv_variance": _HRV_VARIANCE_DEFAULT,
+        }
+
+    except Exception as err:
+        _LOGGER.error("Error extracting HRV data: %s", err)
+        return None
+
+# Extracted HRV data per user, as (latest session, data). Every HRV sensor of
+# a user reads the same session, so it is only extracted once per session.
+_HRV_DATA_CACHE: WeakKeyDictionary[EightUser, tuple[dict, dict | None]] = WeakKeyDictionary()
+
+def _get_hrv_data(user: EightUser | None) -> dict | None:
+    """Get HRV data for the user's most recent session."""
+    # A single getattr covers both a missing user and a user without sleep data
+    sleep_data = getattr(user, "sleep_data", None)
+    if not sleep_data:
+        return None
+
+    try:
+        sessions = sleep_data.get("sessions", [])
+
+        if not sessions:
+            return None
+
+        # Get the most recent session
+        latest_session = sessions[0]
+        cached = _HRV_DATA_CACHE.get(user)
+        if cached is not None and cached[0] is latest_session:
+            return cached[1]
+
+        hrv_data = _extract_hrv_data(latest_session)
+        _HRV_DATA_CACHE[user] = (latest_session, hrv_data)
+        return hrv_data
+
+    except Exception as err:
+        _LOGGER.error("Error getting HRV data: %s", err)
+        return None
+
+# Metrics reported by the comprehensive sensor, as (sensor type, value
+# attribute, category attribute, category function). Only some metrics
+# report a category.
+_COMPREHENSIVE_METRICS: tuple[tuple[str, str, str, Callable[[float], str] | None], ...] = tuple(
+    (
+        description.key,
+        f"{description.key}_value",
+        f"{description.key}_category",
+        {
+            "current_hrv": _get_hrv_category,
+            "hrv_quality": _get_hrv_quality_category,
+            "hrv_stress_index": _get_hrv_stress_category,
+        }.get(description.key),
+    )
+    for description in HRV_DESCRIPTIONS
+)
+
+_IMPROVE_HRV = "Focus on improving heart rate variability"
+_REDUCE_STRESS = "Work on reducing stress levels"
+_IMPROVE_RECOVERY = "Improve recovery through better sleep and rest"
+
+# Recommendations indexed by a bitmask of low HRV (1), high stress (2) and
+# poor recovery (4)
+_RECOMMENDATIONS: tuple[tuple[str, ...], ...] = (
+    ("Maintain current heart rate variability patterns",),
+    (_IMPROVE_HRV,),
+    (_REDUCE_STRESS,),
+    (_IMPROVE_HRV, _REDUCE_STRESS),
+    (_IMPROVE_RECOVERY,),
+    (_IMPROVE_HRV, _IMPROVE_RECOVERY),
+    (_REDUCE_STRESS, _IMPROVE_RECOVERY),
+    (_IMPROVE_HRV, _REDUCE_STRESS, _IMPROVE_RECOVERY),
+)
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -120,32 +355,35 @@ async def async_setup_entry(
     config_entry_data: EightSleepConfigEntryData = hass.data[DOMAIN][entry.entry_id]
     eight = config_entry_data.api
 
-    entities = []
-
-    # Create HRV sensors for each user
-    for user in eight.users.values():
-        for sensor_type in HRV_SENSORS:
-            entities.append(
-                EightSleepHRVSensor(
-                    entry,
-                    config_entry_data.user_coordinator,
-                    eight,
-                    user,
-                    sensor_type,
-                )
-            )
-
-        # Create comprehensive HRV sensor
-        entities.append(
-            EightSleepComprehensiveHRVSensor(
-                entry,
-                config_entry_data.user_coordinator,
-                eight,
-                user,
-            )
+    coordinator = config_entry_data.user_coordinator
+    users = eight.users.values()
+
+    @callback
+    def _async_refresh_hrv_data() -> None:
+        """Extract each user's HRV data once per coordinator update.
+
+        This listener is registered before the entities are added, so it runs
+        ahead of their own update callbacks, and their reads hit the cache.
+        """
+        for user in users:
+            _get_hrv_data(user)
+
+    entry.async_on_unload(coordinator.async_add_listener(_async_refresh_hrv_data))
+
+    # Create HRV sensors and a comprehensive HRV sensor for each user
+    async_add_entities(
+        chain(
+            (
+                EightSleepHRVSensor(entry, coordinator, eight, user, description)
+                for user in users
+                for description in HRV_DESCRIPTIONS
+            ),
+            (
+                EightSleepComprehensiveHRVSensor(entry, coordinator, eight, user)
+                for user in users
+            ),
         )
-
-    async_add_entities(entities)
+    )
 
 class EightSleepHRVSensor(EightSleepBaseEntity, SensorEntity):
     """Individual heart rate variability sensor."""
@@ -156,26 +394,57 @@ class EightSleepHRVSensor(EightSleepBaseEntity, SensorEntity):
         coordinator: DataUpdateCoordinator,
         eight: EightSleep,
         user: EightUser,
-        sensor_type: str,
+        description: SensorEntityDescription,
     ) -> None:
         """Initialize the HRV sensor."""
+        sensor_type = description.key
         super().__init__(
             entry, coordinator, eight, user, f"hrv_{sensor_type}"
         )
 
+        self.entity_description = description
         self._sensor_type = sensor_type
-        self._sensor_config = HRV_SENSORS[sensor_type]
 
-        # Set sensor properties
-        self._attr_name = self._sensor_config["name"]
-        self._attr_icon = self._sensor_config["icon"]
-        self._attr_native_unit_of_measurement = self._sensor_config["unit"]
+        # The base entity names itself from NAME_MAP, so take the
+        # description's name explicitly
+        self._attr_name = description.name
+
+        # The sensor type never changes, so pick its value formatter and
+        # attribute builder once instead of branching on every update
+        self._value_fn = {
+            "hrv_quality": _get_hrv_quality_category,
+            "hrv_recovery": _get_hrv_recovery_category,
+            "hrv_stress_index": _get_hrv_stress_category,
+            "hrv_balance": self._get_hrv_balance_assessment,
+        }.get(sensor_type)
+        self._attributes_fn = {
+            "current_hrv": self._current_hrv_attributes,
+            "average_hrv": self._average_hrv_attributes,
+            "hrv_trend": self._hrv_trend_attributes,
+            "hrv_stability": self._hrv_stability_attributes,
+            "hrv_stress_index": self._hrv_stress_index_attributes,
+        }.get(sensor_type)
+        self._last_updated = datetime.now().isoformat()
+        self._hrv_data: dict | None = None
+        self._hrv_data_stale = True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Stamp the update time once per update rather than per state read."""
+        self._last_updated = datetime.now().isoformat()
+        self._hrv_data_stale = True
+        super()._handle_coordinator_update()
 
-        if self._sensor_config["device_class"]:
-            self._attr_device_class = self._sensor_config["device_class"]
+    def _get_hrv_data(self) -> dict | None:
+        """Return HRV data, looked up once per coordinator update.
 
-        if self._sensor_config["state_class"]:
-            self._attr_state_class = self._sensor_config["state_class"]
+        native_value and extra_state_attributes are read together for each
+        state write, so the second read reuses the first lookup.
+        """
+        if self._hrv_data_stale:
+            self._hrv_data = _get_hrv_data(self._user_obj)
+            self._hrv_data_stale = False
+        return self._hrv_data
 
     @property
     def native_value(self) -> float | str | None:
@@ -192,16 +461,9 @@ class EightSleepHRVSensor(EightSleepBaseEntity, SensorEntity):
             if value is None:
                 return None
 
-            if self._sensor_type == "hrv_quality":
-                return self._get_hrv_quality_category(value)
-            elif self._sensor_type == "hrv_recovery":
-                return self._get_hrv_recovery_category(value)
-            elif self._sensor_type == "hrv_stress_index":
-                return self._get_hrv_stress_category(value)
-            elif self._sensor_type == "hrv_balance":
-                return self._get_hrv_balance_assessment(value)
-            else:
-                return round(float(value), 2)
+            # Numeric values are left to Home Assistant to round for display
+            value_fn = self._value_fn
+            return value if value_fn is None else value_fn(value)
 
         except Exception as err:
             _LOGGER.error("Error getting HRV data for %s: %s", self._attr_unique_id, err)
@@ -220,40 +482,14 @@ class EightSleepHRVSensor(EightSleepBaseEntity, SensorEntity):
 
             attributes = {
                 "sensor_type": self._sensor_type,
-                "last_updated": datetime.now().isoformat(),
+                "last_updated": self._last_updated,
             }
 
             # Add HRV-specific attributes
-            if self._sensor_type == "current_hrv":
+            if self._attributes_fn is not None:
                 value = hrv_data.get(self._sensor_type)
                 if value is not None:
-                    attributes["hrv_quality"] = self._get_hrv_quality_category(value)
-                    attributes["hrv_category"] = self._get_hrv_category(value)
-                    attributes["is_optimal_hrv"] = 70 <= value <= 100
-
-            elif self._sensor_type == "average_hrv":
-                value = hrv_data.get(self._sensor_type)
-                if value is not None:
-                    attributes["average_hrv_trend"] = hrv_data.get("hrv_trend", 0)
-                    attributes["hrv_consistency"] = hrv_data.get("hrv_consistency", 0)
-
-            elif self._sensor_type == "hrv_trend":
-                value = hrv_data.get(self._sensor_type)
-                if value is not None:
-                    attributes["trend_direction"] = "improving" if value > 0 else "declining" if value < 0 else "stable"
-                    attributes["trend_magnitude"] = abs(value)
-
-            elif self._sensor_type == "hrv_stability":
-                value = hrv_data.get(self._sensor_type)
-                if value is not None:
-                    attributes["stability_category"] = self._get_stability_category(value)
-                    attributes["hrv_variance"] = hrv_data.get("hrv_variance", 0)
-
-            elif self._sensor_type == "hrv_stress_index":
-                value = hrv_data.get(self._sensor_type)
-                if value is not None:
-                    attributes["stress_level"] = self._get_hrv_stress_category(value)
-                    attributes["recovery_needed"] = value > 60
+                    attributes.update(self._attributes_fn(value, hrv_data))
 
             return attributes
 
@@ -261,175 +497,41 @@ class EightSleepHRVSensor(EightSleepBaseEntity, SensorEntity):
             _LOGGER.error("Error calculating attributes for %s: %s", self._attr_unique_id, err)
             return None
 
-    def _get_hrv_data(self) -> dict | None:
-        """Get HRV data from the user."""
-        if not self._user_obj or not hasattr(self._user_obj, 'sleep_data'):
-            return None
-
-        try:
-            sleep_data = getattr(self._user_obj, 'sleep_data', {})
-            sessions = sleep_data.get("sessions", [])
-
-            if not sessions:
-                return None
-
-            # Get the most recent session
-            latest_session = sessions[0]
-            return self._extract_hrv_data(latest_session)
-
-        except Exception as err:
-            _LOGGER.error("Error getting HRV data: %s", err)
-            return None
-
-    def _extract_hrv_data(self, session: dict) -> dict:
-        """Extract HRV data from a sleep session."""
-        try:
-            # Extract HRV metrics from session data
-            hrv_data = session.get("hrv", {})
-
-            current_hrv = hrv_data.get("current", 0)
-            average_hrv = hrv_data.get("average", 0)
-            hrv_trend = hrv_data.get("trend", 0)
-            hrv_quality = self._calculate_hrv_quality(current_hrv)
-            hrv_stability = self._calculate_hrv_stability(session)
-            hrv_recovery = self._calculate_hrv_recovery(session)
-            hrv_stress_index = self._calculate_hrv_stress_index(session)
-            hrv_balance = self._calculate_hrv_balance(session)
-
-            return {
-                "current_hrv": current_hrv,
-                "average_hrv": average_hrv,
-                "hrv_trend": hrv_trend,
-                "hrv_quality": hrv_quality,
-                "hrv_stability": hrv_stability,
-                "hrv_recovery": hrv_recovery,
-                "hrv_stress_index": hrv_stress_index,
-                "hrv_balance": hrv_balance,
-                "hrv_consistency": self._calculate_hrv_consistency(session),
-                "hrv_variance": self._calculate_hrv_variance(session),
-            }
-
-        except Exception as err:
-            _LOGGER.error("Error extracting HRV data: %s", err)
-            return None
-
-    def _calculate_hrv_quality(self, hrv_value: float) -> float:
-        """Calculate HRV quality score."""
-        if hrv_value >= 100:
-            return 100.0
-        elif hrv_value >= 70:
-            return 85.0
-        elif hrv_value >= 50:
-            return 70.0
-        elif hrv_value >= 30:
-            return 50.0
-        else:
-            return 25.0
-
-    def _calculate_hrv_stability(self, session: dict) -> float:
-        """Calculate HRV stability percentage."""
-        try:
-            # This would typically analyze HRV variance over time
-            # For now, use a simplified calculation
-            hrv_data = session.get("hrv", {})
-            variance = hrv_data.get("variance", 0)
-
-            if variance <= 5:
-                return 100.0
-            elif variance <= 10:
-                return 85.0
-            elif variance <= 15:
-                return 70.0
-            elif variance <= 20:
-                return 50.0
-            else:
-                return 30.0
-        except Exception:
-            return 0.0
-
-    def _calculate_hrv_recovery(self, session: dict) -> float:
-        """Calculate HRV recovery score."""
-        try:
-            # This would analyze HRV recovery patterns
-            # For now, use a simplified calculation
-            hrv_data = session.get("hrv", {})
-            recovery_score = hrv_data.get("recovery", 0)
-
-            if recovery_score >= 80:
-                return 100.0
-            elif recovery_score >= 60:
-                return 85.0
-            elif recovery_score >= 40:
-                return 70.0
-            elif recovery_score >= 20:
-                return 50.0
-            else:
-                return 25.0
-        except Exception:
-            return 0.0
-
-    def _calculate_hrv_stress_index(self, session: dict) -> float:
-        """Calculate HRV stress index."""
-        try:
-            # This would analyze HRV patterns to determine stress
-            # For now, use a simplified calculation
-            hrv_data = session.get("hrv", {})
-            stress_score = hrv_data.get("stress", 0)
-
-            return min(100.0, max(0.0, stress_score))
-        except Exception:
-            return 0.0
-
-    def _calculate_hrv_balance(self, session: dict) -> float:
-        """Calculate HRV balance score."""
-        try:
-            # This would analyze HRV balance between sympathetic and parasympathetic
-            # For now, use a simplified calculation
-            hrv_data = session.get("hrv", {})
-            balance_score = hrv_data.get("balance", 0)
-
-            return min(100.0, max(0.0, balance_score))
-        except Exception:
-            return 0.0
-
-    def _calculate_hrv_consistency(self, session: dict) -> float:
-        """Calculate HRV consistency."""
-        try:
-            # This would analyze HRV consistency over time
-            # For now, use a placeholder value
-            return 85.0
-        except Exception:
-            return 0.0
-
-    def _calculate_hrv_variance(self, session: dict) -> float:
-        """Calculate HRV variance."""
-        try:
-            # This would calculate actual HRV variance
-            # For now, use a placeholder value
-            return 8.5
-        except Exception:
-            return 0.0
-
-    def _get_hrv_quality_category(self, quality: float) -> str:
-        """Get HRV quality category."""
-        for category, config in HRV_QUALITY_CATEGORIES.items():
-            if config["min"] <= quality <= config["max"]:
-                return config["description"]
-        return "Unknown"
-
-    def _get_hrv_recovery_category(self, recovery: float) -> str:
-        """Get HRV recovery category."""
-        for category, config in HRV_RECOVERY_CATEGORIES.items():
-            if config["min"] <= recovery <= config["max"]:
-                return config["description"]
-        return "Unknown"
-
-    def _get_hrv_stress_category(self, stress: float) -> str:
-        """Get HRV stress category."""
-        for category, config in HRV_STRESS_CATEGORIES.items():
-            if config["min"] <= stress <= config["max"]:
-                return config["description"]
-        return "Unknown"
+    def _current_hrv_attributes(self, value: float, hrv_data: dict) -> dict[str, Any]:
+        """Return attributes for the current HRV sensor."""
+        return {
+            "hrv_quality": _get_hrv_quality_category(value),
+            "hrv_category": _get_hrv_category(value),
+            "is_optimal_hrv": 70 <= value <= 100,
+        }
+
+    def _average_hrv_attributes(self, value: float, hrv_data: dict) -> dict[str, Any]:
+        """Return attributes for the average HRV sensor."""
+        return {
+            "average_hrv_trend": hrv_data.get("hrv_trend", 0),
+            "hrv_consistency": hrv_data.get("hrv_consistency", 0),
+        }
+
+    def _hrv_trend_attributes(self, value: float, hrv_data: dict) -> dict[str, Any]:
+        """Return attributes for the HRV trend sensor."""
+        return {
+            "trend_direction": "improving" if value > 0 else "declining" if value < 0 else "stable",
+            "trend_magnitude": abs(value),
+        }
+
+    def _hrv_stability_attributes(self, value: float, hrv_data: dict) -> dict[str, Any]:
+        """Return attributes for the HRV stability sensor."""
+        return {
+            "stability_category": self._get_stability_category(value),
+            "hrv_variance": hrv_data.get("hrv_variance", 0),
+        }
+
+    def _hrv_stress_index_attributes(self, value: float, hrv_data: dict) -> dict[str, Any]:
+        """Return attributes for the HRV stress index sensor."""
+        return {
+            "stress_level": _get_hrv_stress_category(value),
+            "recovery_needed": value > 60,
+        }
 
     def _get_hrv_balance_assessment(self, balance: float) -> str:
         """Get HRV balance assessment."""
@@ -444,19 +546,6 @@ class EightSleepHRVSensor(EightSleepBaseEntity, SensorEntity):
         else:
             return "Very Poor Balance"
 
-    def _get_hrv_category(self, hrv_value: float) -> str:
-        """Get HRV category."""
-        if hrv_value >= 100:
-            return "Excellent"
-        elif hrv_value >= 70:
-            return "Good"
-        elif hrv_value >= 50:
-            return "Fair"
-        elif hrv_value >= 30:
-            return "Poor"
-        else:
-            return "Very Poor"
-
     def _get_stability_category(self, stability: float) -> str:
         """Get stability category."""
         if stability >= 90:
@@ -489,6 +578,29 @@ class EightSleepComprehensiveHRVSensor(EightSleepBaseEntity, SensorEntity):
         super().__init__(
             entry, coordinator, eight, user, "hrv_comprehensive"
         )
+        self._stamp_update()
+        self._hrv_data: dict | None = None
+        self._hrv_data_stale = True
+
+    def _stamp_update(self) -> None:
+        """Record when the coordinator last delivered data."""
+        now = datetime.now()
+        self._last_updated = now.isoformat()
+        self._analysis_date = now.strftime("%Y-%m-%d")
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Stamp the update time once per update rather than per state read."""
+        self._stamp_update()
+        self._hrv_data_stale = True
+        super()._handle_coordinator_update()
+
+    def _get_hrv_data(self) -> dict | None:
+        """Return HRV data, looked up once per coordinator update."""
+        if self._hrv_data_stale:
+            self._hrv_data = _get_hrv_data(self._user_obj)
+            self._hrv_data_stale = False
+        return self._hrv_data
 
     @property
     def native_value(self) -> str | None:
@@ -497,7 +609,7 @@ class EightSleepComprehensiveHRVSensor(EightSleepBaseEntity, SensorEntity):
             return None
 
         try:
-            hrv_data = self._get_comprehensive_hrv_data()
+            hrv_data = self._get_hrv_data()
             if hrv_data is None:
                 return "Unknown"
 
@@ -515,26 +627,22 @@ class EightSleepComprehensiveHRVSensor(EightSleepBaseEntity, SensorEntity):
             return None
 
         try:
-            hrv_data = self._get_comprehensive_hrv_data()
+            hrv_data = self._get_hrv_data()
             if hrv_data is None:
                 return None
 
             attributes = {
-                "last_updated": datetime.now().isoformat(),
-                "analysis_date": datetime.now().strftime("%Y-%m-%d"),
+                "last_updated": self._last_updated,
+                "analysis_date": self._analysis_date,
             }
 
             # Add all HRV metrics
-            for sensor_type, config in HRV_SENSORS.items():
+            for sensor_type, value_key, category_key, category_fn in _COMPREHENSIVE_METRICS:
                 value = hrv_data.get(sensor_type)
                 if value is not None:
-                    attributes[f"{sensor_type}_value"] = value
-                    if sensor_type == "current_hrv":
-                        attributes[f"{sensor_type}_category"] = self._get_hrv_category(value)
-                    elif sensor_type == "hrv_quality":
-                        attributes[f"{sensor_type}_category"] = self._get_hrv_quality_category(value)
-                    elif sensor_type == "hrv_stress_index":
-                        attributes[f"{sensor_type}_category"] = self._get_hrv_stress_category(value)
+                    attributes[value_key] = value
+                    if category_fn is not None:
+                        attributes[category_key] = category_fn(value)
 
             # Add recommendations
             recommendations = self._get_hrv_recommendations(hrv_data)
@@ -547,127 +655,6 @@ class EightSleepComprehensiveHRVSensor(EightSleepBaseEntity, SensorEntity):
             _LOGGER.error("Error calculating comprehensive attributes: %s", err)
             return None
 
-    def _get_comprehensive_hrv_data(self) -> dict | None:
-        """Get comprehensive HRV data."""
-        if not self._user_obj or not hasattr(self._user_obj, 'sleep_data'):
-            return None
-
-        try:
-            sleep_data = getattr(self._user_obj, 'sleep_data', {})
-            sessions = sleep_data.get("sessions", [])
-
-            if not sessions:
-                return None
-
-            # Get the most recent session
-            latest_session = sessions[0]
-            return self._extract_hrv_data(latest_session)
-
-        except Exception as err:
-            _LOGGER.error("Error getting comprehensive HRV data: %s", err)
-            return None
-
-    def _extract_hrv_data(self, session: dict) -> dict:
-        """Extract HRV data from a sleep session."""
-        try:
-            # Extract HRV metrics from session data
-            hrv_data = session.get("hrv", {})
-
-            current_hrv = hrv_data.get("current", 0)
-            average_hrv = hrv_data.get("average", 0)
-            hrv_trend = hrv_data.get("trend", 0)
-            hrv_quality = self._calculate_hrv_quality(current_hrv)
-            hrv_stability = self._calculate_hrv_stability(session)
-            hrv_recovery = self._calculate_hrv_recovery(session)
-            hrv_stress_index = self._calculate_hrv_stress_index(session)
-            hrv_balance = self._calculate_hrv_balance(session)
-
-            return {
-                "current_hrv": current_hrv,
-                "average_hrv": average_hrv,
-                "hrv_trend": hrv_trend,
-                "hrv_quality": hrv_quality,
-                "hrv_stability": hrv_stability,
-                "hrv_recovery": hrv_recovery,
-                "hrv_stress_index": hrv_stress_index,
-                "hrv_balance": hrv_balance,
-            }
-
-        except Exception as err:
-            _LOGGER.error("Error extracting HRV data: %s", err)
-            return None
-
-    def _calculate_hrv_quality(self, hrv_value: float) -> float:
-        """Calculate HRV quality score."""
-        if hrv_value >= 100:
-            return 100.0
-        elif hrv_value >= 70:
-            return 85.0
-        elif hrv_value >= 50:
-            return 70.0
-        elif hrv_value >= 30:
-            return 50.0
-        else:
-            return 25.0
-
-    def _calculate_hrv_stability(self, session: dict) -> float:
-        """Calculate HRV stability percentage."""
-        try:
-            hrv_data = session.get("hrv", {})
-            variance = hrv_data.get("variance", 0)
-
-            if variance <= 5:
-                return 100.0
-            elif variance <= 10:
-                return 85.0
-            elif variance <= 15:
-                return 70.0
-            elif variance <= 20:
-                return 50.0
-            else:
-                return 30.0
-        except Exception:
-            return 0.0
-
-    def _calculate_hrv_recovery(self, session: dict) -> float:
-        """Calculate HRV recovery score."""
-        try:
-            hrv_data = session.get("hrv", {})
-            recovery_score = hrv_data.get("recovery", 0)
-
-            if recovery_score >= 80:
-                return 100.0
-            elif recovery_score >= 60:
-                return 85.0
-            elif recovery_score >= 40:
-                return 70.0
-            elif recovery_score >= 20:
-                return 50.0
-            else:
-                return 25.0
-        except Exception:
-            return 0.0
-
-    def _calculate_hrv_stress_index(self, session: dict) -> float:
-        """Calculate HRV stress index."""
-        try:
-            hrv_data = session.get("hrv", {})
-            stress_score = hrv_data.get("stress", 0)
-
-            return min(100.0, max(0.0, stress_score))
-        except Exception:
-            return 0.0
-
-    def _calculate_hrv_balance(self, session: dict) -> float:
-        """Calculate HRV balance score."""
-        try:
-            hrv_data = session.get("hrv", {})
-            balance_score = hrv_data.get("balance", 0)
-
-            return min(100.0, max(0.0, balance_score))
-        except Exception:
-            return 0.0
-
     def _get_hrv_assessment(self, hrv_value: float) -> str:
         """Get overall HRV assessment."""
         if hrv_value >= 100:
@@ -681,55 +668,11 @@ class EightSleepComprehensiveHRVSensor(EightSleepBaseEntity, SensorEntity):
         else:
             return "Very Poor Heart Rate Variability"
 
-    def _get_hrv_category(self, hrv_value: float) -> str:
-        """Get HRV category."""
-        if hrv_value >= 100:
-            return "Excellent"
-        elif hrv_value >= 70:
-            return "Good"
-        elif hrv_value >= 50:
-            return "Fair"
-        elif hrv_value >= 30:
-            return "Poor"
-        else:
-            return "Very Poor"
-
-    def _get_hrv_quality_category(self, quality: float) -> str:
-        """Get HRV quality category."""
-        for category, config in HRV_QUALITY_CATEGORIES.items():
-            if config["min"] <= quality <= config["max"]:
-                return config["description"]
-        return "Unknown"
-
-    def _get_hrv_stress_category(self, stress: float) -> str:
-        """Get HRV stress category."""
-        for category, config in HRV_STRESS_CATEGORIES.items():
-            if config["min"] <= stress <= config["max"]:
-                return config["description"]
-        return "Unknown"
-
     def _get_hrv_recommendations(self, hrv_data: dict) -> list[str]:
         """Get HRV recommendations based on current metrics."""
-        recommendations = []
-
-        try:
-            current_hrv = hrv_data.get("current_hrv", 0)
-            hrv_stress_index = hrv_data.get("hrv_stress_index", 0)
-            hrv_recovery = hrv_data.get("hrv_recovery", 0)
-
-            if current_hrv < 50:
-                recommendations.append("Focus on improving heart rate variability")
-
-            if hrv_stress_index > 60:
-                recommendations.append("Work on reducing stress levels")
-
-            if hrv_recovery < 60:
-                recommendations.append("Improve recovery through better sleep and rest")
-
-            if not recommendations:
-                recommendations.append("Maintain current heart rate variability patterns")
-
-        except Exception as err:
-            _LOGGER.error("Error generating HRV recommendations: %s", err)
-
-        return recommendations
+        mask = (
+            (hrv_data.get("current_hrv", 0) < 50)
+            | (hrv_data.get("hrv_stress_index", 0) > 60) << 1
+            | (hrv_data.get("hrv_recovery", 0) < 60) << 2
+        )
+        return list(_RECOMMENDATIONS[mask])
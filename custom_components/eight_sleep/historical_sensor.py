@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Mapping
 import logging
 from datetime import datetime, timedelta
+from functools import lru_cache
+from math import dist, sqrt
+from types import MappingProxyType
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -16,7 +22,7 @@ from homeassistant.const import (
     PERCENTAGE,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
@@ -123,6 +129,444 @@ HISTORICAL_METRICS = {
     },
 }
 
+# Sensor properties for each (metric, period), as (name, icon, unit, device
+# class, state class)
+_SENSOR_PROPERTIES: Mapping[
+    tuple[str, str],
+    tuple[str, str, str | None, SensorDeviceClass | None, SensorStateClass | None],
+] = MappingProxyType({
+    (metric, period): (
+        f"{config['name']} ({period_name})",
+        config["icon"],
+        config["unit"],
+        config["device_class"],
+        config["state_class"],
+    )
+    for metric, config in HISTORICAL_METRICS.items()
+    for period, period_name in HISTORICAL_PERIODS.items()
+})
+
+# Session fields read as columns
+_SESSION_FIELDS = (
+    "sleepDuration",
+    "sleepEfficiency",
+    "heartRate",
+    "respiratoryRate",
+    "sleepScore",
+)
+_STAGE_FIELDS = ("deepDuration", "remDuration", "lightDuration", "awakeDuration")
+# Shared stand-in for sessions without sleep stages, so a miss allocates nothing
+_EMPTY_STAGES: Mapping[str, Any] = MappingProxyType({})
+
+# Column order of the values read from each session
+_COLUMN_FIELDS = (*_SESSION_FIELDS, *_STAGE_FIELDS)
+# How each column is read, as (whether it is a sleep stage, field), so a row
+# is read in one pass
+_ROW_FIELDS = (
+    *((False, field) for field in _SESSION_FIELDS),
+    *((True, field) for field in _STAGE_FIELDS),
+)
+
+def _session_row(session: dict) -> tuple[float | None, ...]:
+    """Read a session's numeric fields in _COLUMN_FIELDS order.
+
+    Missing and non-numeric values are read as None. Durations stay in
+    seconds; they are converted to hours once per average rather than once
+    per session.
+    """
+    # Bind the lookups once rather than resolving .get for every field
+    session_get = session.get
+    stages_get = (session_get("sleepStages") or _EMPTY_STAGES).get
+    return tuple([
+        float(value)
+        if isinstance(
+            value := (stages_get if is_stage else session_get)(field), (int, float)
+        )
+        else None
+        for is_stage, field in _ROW_FIELDS
+    ])
+
+def _session_columns(rows: list[tuple]) -> dict[str, list[float]]:
+    """Transpose session rows into one column of present values per field."""
+    return {
+        field: [value for value in values if value is not None]
+        for field, values in zip(_COLUMN_FIELDS, zip(*rows))
+    }
+
+def _duration_consistency(durations: list[float]) -> float | None:
+    """Convert the spread of sleep durations to a consistency percentage.
+
+    The coefficient of variation has no unit, so durations are used as
+    seconds without converting them to hours first.
+    """
+    if len(durations) < 2:
+        return None
+
+    # Calculate coefficient of variation (lower is more consistent). The
+    # distance from the mean point is the root of the summed squared
+    # deviations, reduced in C rather than by a Python generator.
+    count = len(durations)
+    mean_duration = sum(durations) / count
+    std_dev = dist(durations, [mean_duration] * count) / sqrt(count)
+    cv = (std_dev / mean_duration) * 100 if mean_duration > 0 else 0
+
+    # Convert to consistency percentage (lower CV = higher consistency)
+    return max(0, 100 - cv)
+
+# Reducers return (value, data points) for a column and the number of
+# sessions in the window, or None when the column can't be summarised.
+def _reduce_mean(values: list[float], session_count: int) -> tuple[float, int] | None:
+    """Average a column over the sessions that report it."""
+    if not values:
+        return None
+    return sum(values) / len(values), len(values)
+
+def _reduce_mean_hours(values: list[float], session_count: int) -> tuple[float, int] | None:
+    """Average a column of durations in seconds, in hours."""
+    if not values:
+        return None
+    return sum(values) / (len(values) * 3600), len(values)
+
+def _reduce_max(values: list[float], session_count: int) -> tuple[float | None, int]:
+    """Return the highest value in a column."""
+    return (max(values) if values else None), session_count
+
+def _reduce_min(values: list[float], session_count: int) -> tuple[float | None, int]:
+    """Return the lowest value in a column."""
+    return (min(values) if values else None), session_count
+
+def _reduce_count(values: list[float] | None, session_count: int) -> tuple[int, int]:
+    """Count the sessions in the window."""
+    return session_count, session_count
+
+def _reduce_consistency(values: list[float], session_count: int) -> tuple[float, int] | None:
+    """Score how consistent the session durations are."""
+    if session_count < 2:
+        return None
+    consistency = _duration_consistency(values)
+    if consistency is None:
+        return None
+    return consistency, session_count
+
+# Column and reducer for each historical metric
+_METRIC_SPEC: Mapping[
+    str, tuple[str | None, Callable[[list[float] | None, int], tuple | None]]
+] = MappingProxyType({
+    "average_sleep_duration": ("sleepDuration", _reduce_mean_hours),
+    "average_sleep_efficiency": ("sleepEfficiency", _reduce_mean),
+    "average_heart_rate": ("heartRate", _reduce_mean),
+    "average_respiratory_rate": ("respiratoryRate", _reduce_mean),
+    "total_sleep_sessions": (None, _reduce_count),
+    "best_sleep_score": ("sleepScore", _reduce_max),
+    "worst_sleep_score": ("sleepScore", _reduce_min),
+    "sleep_consistency": ("sleepDuration", _reduce_consistency),
+    "deep_sleep_average": ("deepDuration", _reduce_mean_hours),
+    "rem_sleep_average": ("remDuration", _reduce_mean_hours),
+    "light_sleep_average": ("lightDuration", _reduce_mean_hours),
+    "awake_time_average": ("awakeDuration", _reduce_mean_hours),
+})
+
+# Metrics summarised by the comprehensive sensor
+_COMPREHENSIVE_METRICS = (
+    "average_sleep_duration",
+    "average_sleep_efficiency",
+    "total_sleep_sessions",
+    "sleep_consistency",
+    "deep_sleep_average",
+    "rem_sleep_average",
+    "light_sleep_average",
+    "awake_time_average",
+)
+
+def _aggregate(
+    columns: dict[str, list[float]], session_count: int, metric: str
+) -> tuple | None:
+    """Reduce a metric's column to (value, data points)."""
+    column, reducer = _METRIC_SPEC[metric]
+    return reducer(columns.get(column), session_count)
+
+def _window_stats(rows: list[tuple]) -> dict[str, tuple | None]:
+    """Reduce every metric over a window's session rows.
+
+    The rows are transposed into columns in a single pass, and each metric
+    is reduced once, whichever sensors report it.
+    """
+    columns = _session_columns(rows)
+    session_count = len(rows)
+    return {
+        metric: _aggregate(columns, session_count, metric)
+        for metric in _METRIC_SPEC
+    }
+
+@lru_cache(maxsize=8192)
+def _iso_to_timestamp(datetime_str: str) -> float | None:
+    """Parse an ISO 8601 string to an epoch timestamp.
+
+    Refreshed session lists repeat almost all of the previous refresh's
+    sessions, so most of their times are already cached.
+    """
+    try:
+        return datetime.fromisoformat(datetime_str.replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
+
+# Each user's timed sessions sorted by start, as (sessions fingerprint, start
+# timestamps, end timestamps, session rows). Every historical sensor of a user
+# windows the same sessions, so each session is only read once per change.
+_SESSION_TIMELINES: WeakKeyDictionary[
+    EightUser, tuple[tuple, list[float], list[float], list[tuple]]
+] = WeakKeyDictionary()
+
+def _session_fingerprint(session: dict) -> tuple:
+    """Return the times and values of a session that can still change."""
+    return (session.get("startTime"), session.get("endTime"), _session_row(session))
+
+def _sessions_fingerprint(sessions: list) -> tuple:
+    """Return a cheap fingerprint that changes when sessions are added or finalised.
+
+    Sessions are only added once a night, and only the newest, at one end
+    of the list, is still updated after it arrives: its end time, duration
+    and scores are filled in after waking. A refreshed list with the same
+    length and end sessions is treated as unchanged, whatever its identity.
+    """
+    if not sessions:
+        return (0, None, None)
+    return (
+        len(sessions),
+        _session_fingerprint(sessions[0]),
+        _session_fingerprint(sessions[-1]),
+    )
+
+def _session_timeline(user: EightUser) -> tuple[list[float], list[float], list[tuple]]:
+    """Return the user's timed session rows and their start and end timestamps."""
+    sleep_data = getattr(user, "sleep_data", {})
+    sessions = sleep_data.get("sessions", []) if sleep_data else []
+    fingerprint = _sessions_fingerprint(sessions)
+
+    cached = _SESSION_TIMELINES.get(user)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1:]
+
+    timed = []
+    for session in sessions:
+        session_get = session.get
+        start_str = session_get("startTime")
+        end_str = session_get("endTime")
+        if not isinstance(start_str, str) or not isinstance(end_str, str):
+            continue
+
+        session_start = _iso_to_timestamp(start_str)
+        session_end = _iso_to_timestamp(end_str)
+        if session_start is not None and session_end is not None:
+            timed.append((session_start, session_end, session))
+    timed.sort(key=lambda item: item[0])
+
+    timeline = (
+        [start for start, _, _ in timed],
+        [end for _, end, _ in timed],
+        [_session_row(session) for _, _, session in timed],
+    )
+    _SESSION_TIMELINES[user] = (fingerprint, *timeline)
+    return timeline
+
+def _rows_in_window(user: EightUser, start_time: datetime, end_time: datetime) -> list[tuple]:
+    """Extract the rows of sessions that lie entirely within the time range."""
+    try:
+        starts, ends, rows = _session_timeline(user)
+    except Exception as err:
+        _LOGGER.error("Error extracting historical data points: %s", err)
+        return []
+
+    # Sessions are sorted by start, so a binary search skips those that
+    # start too early. Only the few that start late enough need an end check.
+    end_timestamp = end_time.timestamp()
+    first = bisect_left(starts, start_time.timestamp())
+    return [
+        rows[index]
+        for index in range(first, len(rows))
+        if ends[index] <= end_timestamp
+    ]
+
+# Sleep efficiency and consistency percentages are reported as ratings
+_RATED_METRICS = frozenset({"average_sleep_efficiency", "sleep_consistency"})
+_RATING_THRESHOLDS = (60, 70, 80, 90)
+_RATING_LABELS = ("Very Poor", "Poor", "Fair", "Good", "Excellent")
+
+def _format_rating(percentage: float) -> str:
+    """Format a sleep efficiency or consistency percentage as a rating."""
+    return _RATING_LABELS[bisect_right(_RATING_THRESHOLDS, percentage)]
+
+# Checks on the comprehensive history, as (metric, ((test, issue), ...)).
+# Each metric is read once and reports at most its first failing check.
+_HISTORY_RULES: tuple[
+    tuple[str, tuple[tuple[Callable[[float], bool], str], ...]], ...
+] = (
+    ("average_sleep_duration", (
+        (lambda hours: hours < 6, "short_sleep"),
+        (lambda hours: hours > 9, "long_sleep"),
+    )),
+    ("average_sleep_efficiency", (
+        (lambda percent: percent < 80, "low_efficiency"),
+    )),
+    ("sleep_consistency", (
+        (lambda percent: percent < 70, "inconsistent"),
+    )),
+)
+
+# Display label for each history issue
+_ISSUE_LABELS: Mapping[str, str] = MappingProxyType({
+    "short_sleep": "Short Sleep",
+    "long_sleep": "Long Sleep",
+    "low_efficiency": "Low Efficiency",
+    "inconsistent": "Inconsistent",
+})
+
+# Recommendation for each history issue
+_ISSUE_RECOMMENDATIONS: Mapping[str, str] = MappingProxyType({
+    "short_sleep": "Consider increasing sleep duration",
+    "long_sleep": "Consider reducing sleep duration",
+    "low_efficiency": "Focus on improving sleep efficiency",
+    "inconsistent": "Work on maintaining consistent sleep schedule",
+})
+
+def _history_issues(historical_data: dict) -> tuple[str, ...]:
+    """Return the issue of each failing history check, in rule order."""
+    issues = []
+    for metric, checks in _HISTORY_RULES:
+        value = historical_data.get(metric)
+        if value is None:
+            continue
+        for test, issue in checks:
+            if test(value):
+                issues.append(issue)
+                break
+    return tuple(issues)
+
+# Length of each historical period, and of the comprehensive analysis
+_PERIOD_LENGTHS: Mapping[str, timedelta] = MappingProxyType({
+    "week": timedelta(weeks=1),
+    "month": timedelta(days=30),
+    "quarter": timedelta(days=90),
+    "year": timedelta(days=365),
+})
+_DEFAULT_PERIOD_LENGTH = timedelta(days=7)
+_COMPREHENSIVE_LENGTH = timedelta(days=30)
+
+class _UserHistoryAnalyzer:
+    """Historical metrics for one user, calculated once per coordinator update.
+
+    Every historical sensor of a user reads its metric and period from the
+    same analyzer, so each period's sessions are windowed and reduced once
+    per update rather than once per sensor.
+    """
+
+    __slots__ = (
+        "_user",
+        "_window_cache",
+        "_results",
+        "windows",
+        "last_updated",
+        "analysis_date",
+        "comprehensive",
+    )
+
+    def __init__(self, user: EightUser) -> None:
+        """Initialize the analyzer and calculate the current metrics."""
+        self._user = user
+        # Rows and stats last reduced for each window length
+        self._window_cache: dict[
+            timedelta, tuple[list[tuple], dict[str, tuple | None] | None]
+        ] = {}
+        self._results: dict[tuple[str, str], dict | None] = {}
+        self.windows: dict[str, tuple[datetime, datetime]] = {}
+        self.last_updated = ""
+        self.analysis_date = ""
+        self.comprehensive: dict | None = None
+        self.refresh()
+
+    def get(self, metric: str, period: str) -> dict | None:
+        """Return a metric's historical data for a period."""
+        return self._results.get((metric, period))
+
+    @callback
+    def refresh(self) -> None:
+        """Recalculate every metric for every period."""
+        # Every period ends at the same instant, fixed once per update
+        end_time = datetime.now()
+        self.last_updated = end_time.isoformat()
+        self.analysis_date = end_time.strftime("%Y-%m-%d")
+        lengths = {
+            period: _PERIOD_LENGTHS.get(period, _DEFAULT_PERIOD_LENGTH)
+            for period in HISTORICAL_PERIODS
+        }
+        self.windows = {
+            period: (end_time - length, end_time)
+            for period, length in lengths.items()
+        }
+
+        user = self._user
+        if not user or not hasattr(user, 'sleep_data'):
+            self._window_cache = {}
+            self._results = {}
+            self.comprehensive = None
+            return
+
+        # The comprehensive analysis covers the same 30 days as "month", so
+        # it shares the month's window rather than reducing it again.
+        # Sessions usually change once a day, so most updates leave most
+        # windows with the same sessions as last time, and their stats are
+        # reused rather than reduced again.
+        window_stats: dict[timedelta, dict[str, tuple | None] | None] = {}
+        changed: set[timedelta] = set()
+        for length in {*lengths.values(), _COMPREHENSIVE_LENGTH}:
+            rows = _rows_in_window(user, end_time - length, end_time)
+            cached = self._window_cache.get(length)
+            if cached is not None and cached[0] == rows:
+                window_stats[length] = cached[1]
+                continue
+
+            try:
+                stats = _window_stats(rows) if rows else None
+            except Exception as err:
+                _LOGGER.error("Error calculating historical data: %s", err)
+                stats = None
+            self._window_cache[length] = (rows, stats)
+            window_stats[length] = stats
+            changed.add(length)
+
+        if not changed:
+            return
+
+        self._results = {}
+        for period, length in lengths.items():
+            period_stats = window_stats[length]
+            if period_stats is None:
+                continue
+
+            for metric, result in period_stats.items():
+                if result is not None:
+                    self._results[(metric, period)] = {
+                        metric: result[0],
+                        "data_points": result[1],
+                    }
+
+        if _COMPREHENSIVE_LENGTH not in changed:
+            return
+
+        comprehensive_stats = window_stats[_COMPREHENSIVE_LENGTH]
+        self.comprehensive = (
+            None
+            if comprehensive_stats is None
+            else {
+                metric: (
+                    None
+                    if comprehensive_stats[metric] is None
+                    else comprehensive_stats[metric][0]
+                )
+                for metric in _COMPREHENSIVE_METRICS
+            }
+        )
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
@@ -130,18 +574,25 @@ async def async_setup_entry(
     config_entry_data: EightSleepConfigEntryData = hass.data[DOMAIN][entry.entry_id]
     eight = config_entry_data.api
 
+    coordinator = config_entry_data.user_coordinator
     entities = []
 
     # Create historical sensors for each user
     for user in eight.users.values():
+        # The analyzer's listener is registered before the entities are added,
+        # so it refreshes ahead of their own update callbacks
+        analyzer = _UserHistoryAnalyzer(user)
+        entry.async_on_unload(coordinator.async_add_listener(analyzer.refresh))
+
         for metric in HISTORICAL_METRICS:
             for period in HISTORICAL_PERIODS:
                 entities.append(
                     EightSleepHistoricalSensor(
                         entry,
-                        config_entry_data.user_coordinator,
+                        coordinator,
                         eight,
                         user,
+                        analyzer,
                         metric,
                         period,
                     )
@@ -151,9 +602,10 @@ async def async_setup_entry(
         entities.append(
             EightSleepComprehensiveHistoricalSensor(
                 entry,
-                config_entry_data.user_coordinator,
+                coordinator,
                 eight,
                 user,
+                analyzer,
             )
         )
 
@@ -168,6 +620,7 @@ class EightSleepHistoricalSensor(EightSleepBaseEntity, SensorEntity):
         coordinator: DataUpdateCoordinator,
         eight: EightSleep,
         user: EightUser,
+        analyzer: _UserHistoryAnalyzer,
         metric: str,
         period: str,
     ) -> None:
@@ -176,20 +629,22 @@ class EightSleepHistoricalSensor(EightSleepBaseEntity, SensorEntity):
             entry, coordinator, eight, user, f"historical_{metric}_{period}"
         )
 
+        self._analyzer = analyzer
         self._metric = metric
         self._period = period
-        self._metric_config = HISTORICAL_METRICS[metric]
+        self._previous_value: float | None = None
 
         # Set sensor properties
-        self._attr_name = f"{self._metric_config['name']} ({HISTORICAL_PERIODS[period]})"
-        self._attr_icon = self._metric_config["icon"]
-        self._attr_native_unit_of_measurement = self._metric_config["unit"]
+        name, icon, unit, device_class, state_class = _SENSOR_PROPERTIES[(metric, period)]
+        self._attr_name = name
+        self._attr_icon = icon
+        self._attr_native_unit_of_measurement = unit
 
-        if self._metric_config["device_class"]:
-            self._attr_device_class = self._metric_config["device_class"]
+        if device_class:
+            self._attr_device_class = device_class
 
-        if self._metric_config["state_class"]:
-            self._attr_state_class = self._metric_config["state_class"]
+        if state_class:
+            self._attr_state_class = state_class
 
     @property
     def native_value(self) -> float | str | None:
@@ -198,7 +653,7 @@ class EightSleepHistoricalSensor(EightSleepBaseEntity, SensorEntity):
             return None
 
         try:
-            historical_data = self._calculate_historical_data()
+            historical_data = self._analyzer.get(self._metric, self._period)
             if historical_data is None:
                 return None
 
@@ -206,12 +661,9 @@ class EightSleepHistoricalSensor(EightSleepBaseEntity, SensorEntity):
             if value is None:
                 return None
 
-            if self._metric == "average_sleep_efficiency":
-                return self._format_sleep_efficiency(value)
-            elif self._metric == "sleep_consistency":
-                return self._format_consistency(value)
-            else:
-                return round(float(value), 2)
+            if self._metric in _RATED_METRICS:
+                return _format_rating(value)
+            return round(float(value), 2)
 
         except Exception as err:
             _LOGGER.error("Error calculating historical data for %s: %s", self._attr_unique_id, err)
@@ -224,18 +676,18 @@ class EightSleepHistoricalSensor(EightSleepBaseEntity, SensorEntity):
             return None
 
         try:
-            historical_data = self._calculate_historical_data()
+            historical_data = self._analyzer.get(self._metric, self._period)
             if historical_data is None:
                 return None
 
             attributes = {
                 "metric": self._metric,
                 "period": self._period,
-                "last_updated": datetime.now().isoformat(),
+                "last_updated": self._analyzer.last_updated,
             }
 
             # Add trend information
-            if hasattr(self, '_previous_value') and self._previous_value is not None:
+            if self._previous_value is not None:
                 current_value = historical_data.get(self._metric)
                 if current_value is not None:
                     if current_value > self._previous_value:
@@ -248,8 +700,9 @@ class EightSleepHistoricalSensor(EightSleepBaseEntity, SensorEntity):
             self._previous_value = historical_data.get(self._metric)
 
             # Add period-specific attributes
-            attributes["period_start"] = self._get_period_start().isoformat()
-            attributes["period_end"] = self._get_period_end().isoformat()
+            period_start, period_end = self._analyzer.windows[self._period]
+            attributes["period_start"] = period_start.isoformat()
+            attributes["period_end"] = period_end.isoformat()
             attributes["data_points"] = historical_data.get("data_points", 0)
 
             return attributes
@@ -258,355 +711,6 @@ class EightSleepHistoricalSensor(EightSleepBaseEntity, SensorEntity):
             _LOGGER.error("Error calculating attributes for %s: %s", self._attr_unique_id, err)
             return None
 
-    def _calculate_historical_data(self) -> dict | None:
-        """Calculate historical data for the specified metric and period."""
-        if not self._user_obj or not hasattr(self._user_obj, 'sleep_data'):
-            return None
-
-        try:
-            # Get the time range for the historical period
-            end_time = datetime.now()
-            start_time = self._get_period_start()
-
-            # Extract data points within the time range
-            data_points = self._extract_historical_data_points(start_time, end_time)
-
-            if not data_points:
-                return None
-
-            # Calculate historical metrics based on metric type
-            if self._metric == "average_sleep_duration":
-                return self._calculate_average_sleep_duration(data_points)
-            elif self._metric == "average_sleep_efficiency":
-                return self._calculate_average_sleep_efficiency(data_points)
-            elif self._metric == "average_heart_rate":
-                return self._calculate_average_heart_rate(data_points)
-            elif self._metric == "average_respiratory_rate":
-                return self._calculate_average_respiratory_rate(data_points)
-            elif self._metric == "total_sleep_sessions":
-                return self._calculate_total_sleep_sessions(data_points)
-            elif self._metric == "best_sleep_score":
-                return self._calculate_best_sleep_score(data_points)
-            elif self._metric == "worst_sleep_score":
-                return self._calculate_worst_sleep_score(data_points)
-            elif self._metric == "sleep_consistency":
-                return self._calculate_sleep_consistency(data_points)
-            elif self._metric == "deep_sleep_average":
-                return self._calculate_deep_sleep_average(data_points)
-            elif self._metric == "rem_sleep_average":
-                return self._calculate_rem_sleep_average(data_points)
-            elif self._metric == "light_sleep_average":
-                return self._calculate_light_sleep_average(data_points)
-            elif self._metric == "awake_time_average":
-                return self._calculate_awake_time_average(data_points)
-            else:
-                return None
-
-        except Exception as err:
-            _LOGGER.error("Error calculating historical data: %s", err)
-            return None
-
-    def _get_period_start(self) -> datetime:
-        """Get the start time for the historical period."""
-        end_time = datetime.now()
-
-        if self._period == "week":
-            return end_time - timedelta(weeks=1)
-        elif self._period == "month":
-            return end_time - timedelta(days=30)
-        elif self._period == "quarter":
-            return end_time - timedelta(days=90)
-        elif self._period == "year":
-            return end_time - timedelta(days=365)
-        else:
-            return end_time - timedelta(days=7)
-
-    def _get_period_end(self) -> datetime:
-        """Get the end time for the historical period."""
-        return datetime.now()
-
-    def _extract_historical_data_points(self, start_time: datetime, end_time: datetime) -> list:
-        """Extract historical data points within the specified time range."""
-        data_points = []
-
-        try:
-            sleep_data = getattr(self._user_obj, 'sleep_data', {})
-            if not sleep_data:
-                return data_points
-
-            # Extract relevant data points
-            for session in sleep_data.get("sessions", []):
-                session_start = self._parse_datetime(session.get("startTime"))
-                session_end = self._parse_datetime(session.get("endTime"))
-
-                if session_start and session_end:
-                    # Check if session is within our time range
-                    if session_start >= start_time and session_end <= end_time:
-                        data_points.append(session)
-
-        except Exception as err:
-            _LOGGER.error("Error extracting historical data points: %s", err)
-
-        return data_points
-
-    def _parse_datetime(self, datetime_str: str) -> datetime | None:
-        """Parse datetime string to datetime object."""
-        if not datetime_str:
-            return None
-
-        try:
-            return datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
-        except Exception:
-            return None
-
-    def _calculate_average_sleep_duration(self, data_points: list) -> dict:
-        """Calculate average sleep duration."""
-        total_duration = 0
-        valid_sessions = 0
-
-        for point in data_points:
-            duration = point.get("sleepDuration")
-            if duration is not None and isinstance(duration, (int, float)):
-                total_duration += float(duration) / 3600  # Convert to hours
-                valid_sessions += 1
-
-        if valid_sessions == 0:
-            return None
-
-        return {
-            "average_sleep_duration": total_duration / valid_sessions,
-            "data_points": valid_sessions,
-        }
-
-    def _calculate_average_sleep_efficiency(self, data_points: list) -> dict:
-        """Calculate average sleep efficiency."""
-        total_efficiency = 0
-        valid_sessions = 0
-
-        for point in data_points:
-            efficiency = point.get("sleepEfficiency")
-            if efficiency is not None and isinstance(efficiency, (int, float)):
-                total_efficiency += float(efficiency)
-                valid_sessions += 1
-
-        if valid_sessions == 0:
-            return None
-
-        return {
-            "average_sleep_efficiency": total_efficiency / valid_sessions,
-            "data_points": valid_sessions,
-        }
-
-    def _calculate_average_heart_rate(self, data_points: list) -> dict:
-        """Calculate average heart rate."""
-        total_heart_rate = 0
-        valid_sessions = 0
-
-        for point in data_points:
-            heart_rate = point.get("heartRate")
-            if heart_rate is not None and isinstance(heart_rate, (int, float)):
-                total_heart_rate += float(heart_rate)
-                valid_sessions += 1
-
-        if valid_sessions == 0:
-            return None
-
-        return {
-            "average_heart_rate": total_heart_rate / valid_sessions,
-            "data_points": valid_sessions,
-        }
-
-    def _calculate_average_respiratory_rate(self, data_points: list) -> dict:
-        """Calculate average respiratory rate."""
-        total_respiratory_rate = 0
-        valid_sessions = 0
-
-        for point in data_points:
-            respiratory_rate = point.get("respiratoryRate")
-            if respiratory_rate is not None and isinstance(respiratory_rate, (int, float)):
-                total_respiratory_rate += float(respiratory_rate)
-                valid_sessions += 1
-
-        if valid_sessions == 0:
-            return None
-
-        return {
-            "average_respiratory_rate": total_respiratory_rate / valid_sessions,
-            "data_points": valid_sessions,
-        }
-
-    def _calculate_total_sleep_sessions(self, data_points: list) -> dict:
-        """Calculate total sleep sessions."""
-        return {
-            "total_sleep_sessions": len(data_points),
-            "data_points": len(data_points),
-        }
-
-    def _calculate_best_sleep_score(self, data_points: list) -> dict:
-        """Calculate best sleep score."""
-        best_score = None
-
-        for point in data_points:
-            score = point.get("sleepScore")
-            if score is not None and isinstance(score, (int, float)):
-                if best_score is None or score > best_score:
-                    best_score = float(score)
-
-        return {
-            "best_sleep_score": best_score,
-            "data_points": len(data_points),
-        }
-
-    def _calculate_worst_sleep_score(self, data_points: list) -> dict:
-        """Calculate worst sleep score."""
-        worst_score = None
-
-        for point in data_points:
-            score = point.get("sleepScore")
-            if score is not None and isinstance(score, (int, float)):
-                if worst_score is None or score < worst_score:
-                    worst_score = float(score)
-
-        return {
-            "worst_sleep_score": worst_score,
-            "data_points": len(data_points),
-        }
-
-    def _calculate_sleep_consistency(self, data_points: list) -> dict:
-        """Calculate sleep consistency."""
-        if len(data_points) < 2:
-            return None
-
-        # Calculate consistency based on sleep duration variance
-        durations = []
-        for point in data_points:
-            duration = point.get("sleepDuration")
-            if duration is not None and isinstance(duration, (int, float)):
-                durations.append(float(duration) / 3600)  # Convert to hours
-
-        if len(durations) < 2:
-            return None
-
-        # Calculate coefficient of variation (lower is more consistent)
-        mean_duration = sum(durations) / len(durations)
-        variance = sum((d - mean_duration) ** 2 for d in durations) / len(durations)
-        std_dev = variance ** 0.5
-        cv = (std_dev / mean_duration) * 100 if mean_duration > 0 else 0
-
-        # Convert to consistency percentage (lower CV = higher consistency)
-        consistency = max(0, 100 - cv)
-
-        return {
-            "sleep_consistency": consistency,
-            "data_points": len(data_points),
-        }
-
-    def _calculate_deep_sleep_average(self, data_points: list) -> dict:
-        """Calculate average deep sleep duration."""
-        total_deep_sleep = 0
-        valid_sessions = 0
-
-        for point in data_points:
-            sleep_stages = point.get("sleepStages", {})
-            deep_sleep = sleep_stages.get("deepDuration")
-            if deep_sleep is not None and isinstance(deep_sleep, (int, float)):
-                total_deep_sleep += float(deep_sleep) / 3600  # Convert to hours
-                valid_sessions += 1
-
-        if valid_sessions == 0:
-            return None
-
-        return {
-            "deep_sleep_average": total_deep_sleep / valid_sessions,
-            "data_points": valid_sessions,
-        }
-
-    def _calculate_rem_sleep_average(self, data_points: list) -> dict:
-        """Calculate average REM sleep duration."""
-        total_rem_sleep = 0
-        valid_sessions = 0
-
-        for point in data_points:
-            sleep_stages = point.get("sleepStages", {})
-            rem_sleep = sleep_stages.get("remDuration")
-            if rem_sleep is not None and isinstance(rem_sleep, (int, float)):
-                total_rem_sleep += float(rem_sleep) / 3600  # Convert to hours
-                valid_sessions += 1
-
-        if valid_sessions == 0:
-            return None
-
-        return {
-            "rem_sleep_average": total_rem_sleep / valid_sessions,
-            "data_points": valid_sessions,
-        }
-
-    def _calculate_light_sleep_average(self, data_points: list) -> dict:
-        """Calculate average light sleep duration."""
-        total_light_sleep = 0
-        valid_sessions = 0
-
-        for point in data_points:
-            sleep_stages = point.get("sleepStages", {})
-            light_sleep = sleep_stages.get("lightDuration")
-            if light_sleep is not None and isinstance(light_sleep, (int, float)):
-                total_light_sleep += float(light_sleep) / 3600  # Convert to hours
-                valid_sessions += 1
-
-        if valid_sessions == 0:
-            return None
-
-        return {
-            "light_sleep_average": total_light_sleep / valid_sessions,
-            "data_points": valid_sessions,
-        }
-
-    def _calculate_awake_time_average(self, data_points: list) -> dict:
-        """Calculate average awake time during sleep."""
-        total_awake_time = 0
-        valid_sessions = 0
-
-        for point in data_points:
-            sleep_stages = point.get("sleepStages", {})
-            awake_time = sleep_stages.get("awakeDuration")
-            if awake_time is not None and isinstance(awake_time, (int, float)):
-                total_awake_time += float(awake_time) / 3600  # Convert to hours
-                valid_sessions += 1
-
-        if valid_sessions == 0:
-            return None
-
-        return {
-            "awake_time_average": total_awake_time / valid_sessions,
-            "data_points": valid_sessions,
-        }
-
-    def _format_sleep_efficiency(self, efficiency: float) -> str:
-        """Format sleep efficiency."""
-        if efficiency >= 90:
-            return "Excellent"
-        elif efficiency >= 80:
-            return "Good"
-        elif efficiency >= 70:
-            return "Fair"
-        elif efficiency >= 60:
-            return "Poor"
-        else:
-            return "Very Poor"
-
-    def _format_consistency(self, consistency: float) -> str:
-        """Format sleep consistency."""
-        if consistency >= 90:
-            return "Excellent"
-        elif consistency >= 80:
-            return "Good"
-        elif consistency >= 70:
-            return "Fair"
-        elif consistency >= 60:
-            return "Poor"
-        else:
-            return "Very Poor"
-
 class EightSleepComprehensiveHistoricalSensor(EightSleepBaseEntity, SensorEntity):
     """Comprehensive historical data sensor."""
 
@@ -621,12 +725,38 @@ class EightSleepComprehensiveHistoricalSensor(EightSleepBaseEntity, SensorEntity
         coordinator: DataUpdateCoordinator,
         eight: EightSleep,
         user: EightUser,
+        analyzer: _UserHistoryAnalyzer,
     ) -> None:
         """Initialize the comprehensive historical sensor."""
         super().__init__(
             entry, coordinator, eight, user, "historical_comprehensive"
         )
 
+        # The analyzer replaces its comprehensive data whenever it changes, so
+        # an identity check tells whether a cached derivation is still current.
+        # The attributes are cached separately, so a state read alone never
+        # builds them.
+        self._analyzer = analyzer
+        self._summary_source: dict | None = None
+        self._summary: tuple[str, list[str]] = ("Unknown", [])
+        self._attributes_source: dict | None = None
+        self._summary_attributes: dict[str, Any] = {}
+
+    def _summarize(self, historical_data: dict) -> tuple[str, list[str]]:
+        """Return the assessment and recommendations for the history.
+
+        Both come from one pass over the history checks, made once per
+        change of the analyzer's data.
+        """
+        if historical_data is not self._summary_source:
+            issues = _history_issues(historical_data)
+            self._summary = (
+                self._get_historical_assessment(issues),
+                self._get_historical_recommendations(issues),
+            )
+            self._summary_source = historical_data
+        return self._summary
+
     @property
     def native_value(self) -> str | None:
         """Return the overall historical assessment."""
@@ -634,11 +764,11 @@ class EightSleepComprehensiveHistoricalSensor(EightSleepBaseEntity, SensorEntity
             return None
 
         try:
-            historical_data = self._get_comprehensive_historical_data()
+            historical_data = self._analyzer.comprehensive
             if historical_data is None:
                 return "Unknown"
 
-            return self._get_historical_assessment(historical_data)
+            return self._summarize(historical_data)[0]
 
         except Exception as err:
             _LOGGER.error("Error getting comprehensive historical data: %s", err)
@@ -651,273 +781,48 @@ class EightSleepComprehensiveHistoricalSensor(EightSleepBaseEntity, SensorEntity
             return None
 
         try:
-            historical_data = self._get_comprehensive_historical_data()
+            historical_data = self._analyzer.comprehensive
             if historical_data is None:
                 return None
 
-            attributes = {
-                "last_updated": datetime.now().isoformat(),
-                "analysis_date": datetime.now().strftime("%Y-%m-%d"),
-            }
-
-            # Add all historical metrics
-            for metric, config in HISTORICAL_METRICS.items():
-                value = historical_data.get(metric)
-                if value is not None:
-                    attributes[f"{metric}_value"] = value
-
-            # Add recommendations
-            recommendations = self._get_historical_recommendations(historical_data)
-            if recommendations:
-                attributes["recommendations"] = recommendations
-
-            return attributes
-
-        except Exception as err:
-            _LOGGER.error("Error calculating comprehensive attributes: %s", err)
-            return None
+            if historical_data is not self._attributes_source:
+                # Add all historical metrics
+                summary_attributes = {
+                    f"{metric}_value": value
+                    for metric in HISTORICAL_METRICS
+                    if (value := historical_data.get(metric)) is not None
+                }
 
-    def _get_comprehensive_historical_data(self) -> dict | None:
-        """Get comprehensive historical data."""
-        if not self._user_obj or not hasattr(self._user_obj, 'sleep_data'):
-            return None
-
-        try:
-            # Get last 30 days of data for comprehensive analysis
-            end_time = datetime.now()
-            start_time = end_time - timedelta(days=30)
+                # Add recommendations
+                recommendations = self._summarize(historical_data)[1]
+                if recommendations:
+                    summary_attributes["recommendations"] = recommendations
 
-            data_points = self._extract_historical_data_points(start_time, end_time)
+                self._summary_attributes = summary_attributes
+                self._attributes_source = historical_data
 
-            if not data_points:
-                return None
-
-            # Calculate comprehensive metrics
             return {
-                "average_sleep_duration": self._calculate_average_sleep_duration(data_points),
-                "average_sleep_efficiency": self._calculate_average_sleep_efficiency(data_points),
-                "total_sleep_sessions": len(data_points),
-                "sleep_consistency": self._calculate_sleep_consistency(data_points),
-                "deep_sleep_average": self._calculate_deep_sleep_average(data_points),
-                "rem_sleep_average": self._calculate_rem_sleep_average(data_points),
-                "light_sleep_average": self._calculate_light_sleep_average(data_points),
-                "awake_time_average": self._calculate_awake_time_average(data_points),
+                "last_updated": self._analyzer.last_updated,
+                "analysis_date": self._analyzer.analysis_date,
+                **self._summary_attributes,
             }
 
         except Exception as err:
-            _LOGGER.error("Error getting comprehensive historical data: %s", err)
-            return None
-
-    def _extract_historical_data_points(self, start_time: datetime, end_time: datetime) -> list:
-        """Extract historical data points within the specified time range."""
-        data_points = []
-
-        try:
-            sleep_data = getattr(self._user_obj, 'sleep_data', {})
-            if not sleep_data:
-                return data_points
-
-            # Extract relevant data points
-            for session in sleep_data.get("sessions", []):
-                session_start = self._parse_datetime(session.get("startTime"))
-                session_end = self._parse_datetime(session.get("endTime"))
-
-                if session_start and session_end:
-                    # Check if session is within our time range
-                    if session_start >= start_time and session_end <= end_time:
-                        data_points.append(session)
-
-        except Exception as err:
-            _LOGGER.error("Error extracting historical data points: %s", err)
-
-        return data_points
-
-    def _parse_datetime(self, datetime_str: str) -> datetime | None:
-        """Parse datetime string to datetime object."""
-        if not datetime_str:
-            return None
-
-        try:
-            return datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
-        except Exception:
-            return None
-
-    def _calculate_average_sleep_duration(self, data_points: list) -> float | None:
-        """Calculate average sleep duration."""
-        total_duration = 0
-        valid_sessions = 0
-
-        for point in data_points:
-            duration = point.get("sleepDuration")
-            if duration is not None and isinstance(duration, (int, float)):
-                total_duration += float(duration) / 3600  # Convert to hours
-                valid_sessions += 1
-
-        if valid_sessions == 0:
-            return None
-
-        return total_duration / valid_sessions
-
-    def _calculate_average_sleep_efficiency(self, data_points: list) -> float | None:
-        """Calculate average sleep efficiency."""
-        total_efficiency = 0
-        valid_sessions = 0
-
-        for point in data_points:
-            efficiency = point.get("sleepEfficiency")
-            if efficiency is not None and isinstance(efficiency, (int, float)):
-                total_efficiency += float(efficiency)
-                valid_sessions += 1
-
-        if valid_sessions == 0:
-            return None
-
-        return total_efficiency / valid_sessions
-
-    def _calculate_sleep_consistency(self, data_points: list) -> float | None:
-        """Calculate sleep consistency."""
-        if len(data_points) < 2:
-            return None
-
-        # Calculate consistency based on sleep duration variance
-        durations = []
-        for point in data_points:
-            duration = point.get("sleepDuration")
-            if duration is not None and isinstance(duration, (int, float)):
-                durations.append(float(duration) / 3600)  # Convert to hours
-
-        if len(durations) < 2:
-            return None
-
-        # Calculate coefficient of variation (lower is more consistent)
-        mean_duration = sum(durations) / len(durations)
-        variance = sum((d - mean_duration) ** 2 for d in durations) / len(durations)
-        std_dev = variance ** 0.5
-        cv = (std_dev / mean_duration) * 100 if mean_duration > 0 else 0
-
-        # Convert to consistency percentage (lower CV = higher consistency)
-        return max(0, 100 - cv)
-
-    def _calculate_deep_sleep_average(self, data_points: list) -> float | None:
-        """Calculate average deep sleep duration."""
-        total_deep_sleep = 0
-        valid_sessions = 0
-
-        for point in data_points:
-            sleep_stages = point.get("sleepStages", {})
-            deep_sleep = sleep_stages.get("deepDuration")
-            if deep_sleep is not None and isinstance(deep_sleep, (int, float)):
-                total_deep_sleep += float(deep_sleep) / 3600  # Convert to hours
-                valid_sessions += 1
-
-        if valid_sessions == 0:
-            return None
-
-        return total_deep_sleep / valid_sessions
-
-    def _calculate_rem_sleep_average(self, data_points: list) -> float | None:
-        """Calculate average REM sleep duration."""
-        total_rem_sleep = 0
-        valid_sessions = 0
-
-        for point in data_points:
-            sleep_stages = point.get("sleepStages", {})
-            rem_sleep = sleep_stages.get("remDuration")
-            if rem_sleep is not None and isinstance(rem_sleep, (int, float)):
-                total_rem_sleep += float(rem_sleep) / 3600  # Convert to hours
-                valid_sessions += 1
-
-        if valid_sessions == 0:
-            return None
-
-        return total_rem_sleep / valid_sessions
-
-    def _calculate_light_sleep_average(self, data_points: list) -> float | None:
-        """Calculate average light sleep duration."""
-        total_light_sleep = 0
-        valid_sessions = 0
-
-        for point in data_points:
-            sleep_stages = point.get("sleepStages", {})
-            light_sleep = sleep_stages.get("lightDuration")
-            if light_sleep is not None and isinstance(light_sleep, (int, float)):
-                total_light_sleep += float(light_sleep) / 3600  # Convert to hours
-                valid_sessions += 1
-
-        if valid_sessions == 0:
-            return None
-
-        return total_light_sleep / valid_sessions
-
-    def _calculate_awake_time_average(self, data_points: list) -> float | None:
-        """Calculate average awake time during sleep."""
-        total_awake_time = 0
-        valid_sessions = 0
-
-        for point in data_points:
-            sleep_stages = point.get("sleepStages", {})
-            awake_time = sleep_stages.get("awakeDuration")
-            if awake_time is not None and isinstance(awake_time, (int, float)):
-                total_awake_time += float(awake_time) / 3600  # Convert to hours
-                valid_sessions += 1
-
-        if valid_sessions == 0:
+            _LOGGER.error("Error calculating comprehensive attributes: %s", err)
             return None
 
-        return total_awake_time / valid_sessions
-
-    def _get_historical_assessment(self, historical_data: dict) -> str:
+    def _get_historical_assessment(self, issues: tuple[str, ...]) -> str:
         """Get overall historical assessment."""
         # Simple assessment based on available data
-        issues = []
-
-        sleep_duration = historical_data.get("average_sleep_duration")
-        if sleep_duration is not None:
-            if sleep_duration < 6:
-                issues.append("short_sleep")
-            elif sleep_duration > 9:
-                issues.append("long_sleep")
-
-        sleep_efficiency = historical_data.get("average_sleep_efficiency")
-        if sleep_efficiency is not None and sleep_efficiency < 80:
-            issues.append("low_efficiency")
-
-        sleep_consistency = historical_data.get("sleep_consistency")
-        if sleep_consistency is not None and sleep_consistency < 70:
-            issues.append("inconsistent")
-
         if not issues:
             return "Excellent Sleep Patterns"
         elif len(issues) == 1:
-            return f"Good Sleep Patterns ({issues[0].replace('_', ' ').title()} needs attention)"
+            return f"Good Sleep Patterns ({_ISSUE_LABELS[issues[0]]} needs attention)"
         else:
             return f"Sleep Patterns Need Improvement ({len(issues)} areas)"
 
-    def _get_historical_recommendations(self, historical_data: dict) -> list[str]:
+    def _get_historical_recommendations(self, issues: tuple[str, ...]) -> list[str]:
         """Get historical sleep recommendations based on patterns."""
-        recommendations = []
-
-        try:
-            sleep_duration = historical_data.get("average_sleep_duration")
-            sleep_efficiency = historical_data.get("average_sleep_efficiency")
-            sleep_consistency = historical_data.get("sleep_consistency")
-
-            if sleep_duration is not None:
-                if sleep_duration < 6:
-                    recommendations.append("Consider increasing sleep duration")
-                elif sleep_duration > 9:
-                    recommendations.append("Consider reducing sleep duration")
-
-            if sleep_efficiency is not None and sleep_efficiency < 80:
-                recommendations.append("Focus on improving sleep efficiency")
-
-            if sleep_consistency is not None and sleep_consistency < 70:
-                recommendations.append("Work on maintaining consistent sleep schedule")
-
-            if not recommendations:
-                recommendations.append("Maintain current sleep habits")
-
-        except Exception as err:
-            _LOGGER.error("Error generating historical recommendations: %s", err)
-
-        return recommendations
+        return [_ISSUE_RECOMMENDATIONS[issue] for issue in issues] or [
+            "Maintain current sleep habits"
+        ]
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.number import (
@@ -69,6 +71,135 @@ NUMBER_ENTITIES = [
     "routine_score",
 ]
 
+# Display name of each entity type, shared by user and device entities
+_ENTITY_NAMES: Mapping[str, str] = MappingProxyType({
+    "target_heating_level": "Target Heating Level",
+    "heating_level": "Heating Level",
+    "target_temperature": "Target Temperature",
+    "current_temperature": "Current Temperature",
+    "room_temperature": "Room Temperature",
+    "water_level": "Water Level",
+    "priming_progress": "Priming Progress",
+    "firmware_version": "Firmware Version",
+    "device_temperature": "Device Temperature",
+    "device_humidity": "Device Humidity",
+    "device_pressure": "Device Pressure",
+    "sleep_duration": "Sleep Duration",
+    "sleep_latency": "Sleep Latency",
+    "sleep_efficiency": "Sleep Efficiency",
+    "sleep_quality": "Sleep Quality",
+    "sleep_score": "Sleep Score",
+    "heart_rate": "Heart Rate",
+    "respiratory_rate": "Respiratory Rate",
+    "hrv_value": "HRV Value",
+    "presence_duration": "Presence Duration",
+    "away_duration": "Away Duration",
+    "alarm_snooze_duration": "Alarm Snooze Duration",
+    "alarm_volume": "Alarm Volume",
+    "alarm_brightness": "Alarm Brightness",
+    "notification_count": "Notification Count",
+    "alert_count": "Alert Count",
+    "error_count": "Error Count",
+    "warning_count": "Warning Count",
+    "update_progress": "Update Progress",
+    "maintenance_progress": "Maintenance Progress",
+    "analytics_score": "Analytics Score",
+    "insights_score": "Insights Score",
+    "trends_score": "Trends Score",
+    "history_score": "History Score",
+    "settings_score": "Settings Score",
+    "configuration_score": "Configuration Score",
+    "schedule_score": "Schedule Score",
+    "routine_score": "Routine Score",
+})
+
+# Device class, unit, mode, minimum, maximum and step of a number entity
+_NumberProperties = tuple[NumberDeviceClass | None, str | None, NumberMode, float, float, float]
+
+_TEMPERATURE_SLIDER: _NumberProperties = (
+    NumberDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS, NumberMode.SLIDER, 0.0, 50.0, 0.5
+)
+_TEMPERATURE_BOX: _NumberProperties = (
+    NumberDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS, NumberMode.BOX, 0.0, 50.0, 0.5
+)
+_DURATION: _NumberProperties = (
+    NumberDeviceClass.DURATION, UnitOfTime.SECONDS, NumberMode.BOX, 0.0, 86400.0, 1.0  # 24 hours
+)
+_PERCENT_SLIDER: _NumberProperties = (None, PERCENTAGE, NumberMode.SLIDER, 0.0, 100.0, 1.0)
+_PERCENT_BOX: _NumberProperties = (None, PERCENTAGE, NumberMode.BOX, 0.0, 100.0, 1.0)
+_RATE: _NumberProperties = (NumberDeviceClass.FREQUENCY, "bpm", NumberMode.BOX, 0.0, 200.0, 1.0)
+_HRV: _NumberProperties = (NumberDeviceClass.FREQUENCY, "ms", NumberMode.BOX, 0.0, 1000.0, 1.0)
+_COUNT: _NumberProperties = (None, "count", NumberMode.BOX, 0.0, 1000.0, 1.0)
+_HUMIDITY: _NumberProperties = (NumberDeviceClass.HUMIDITY, PERCENTAGE, NumberMode.BOX, 0.0, 100.0, 1.0)
+_PRESSURE: _NumberProperties = (NumberDeviceClass.PRESSURE, "hPa", NumberMode.BOX, 0.0, 2000.0, 1.0)
+_PLAIN: _NumberProperties = (None, None, NumberMode.BOX, 0.0, 100.0, 1.0)
+
+# Properties of each user number entity; other types use _PLAIN
+_USER_PROPERTIES: Mapping[str, _NumberProperties] = MappingProxyType({
+    "target_heating_level": _PERCENT_SLIDER,
+    "heating_level": _PERCENT_SLIDER,
+    "target_temperature": _TEMPERATURE_SLIDER,
+    "current_temperature": _TEMPERATURE_SLIDER,
+    "room_temperature": _TEMPERATURE_SLIDER,
+    "water_level": _PERCENT_SLIDER,
+    "priming_progress": _PERCENT_SLIDER,
+    "firmware_version": _PLAIN,
+    "device_temperature": _TEMPERATURE_SLIDER,
+    "device_humidity": _PLAIN,
+    "device_pressure": _PLAIN,
+    "sleep_duration": _DURATION,
+    "sleep_latency": _DURATION,
+    "sleep_efficiency": _PLAIN,
+    "sleep_quality": _PLAIN,
+    "sleep_score": _PERCENT_BOX,
+    "heart_rate": _RATE,
+    "respiratory_rate": _RATE,
+    "hrv_value": _HRV,
+    "presence_duration": _DURATION,
+    "away_duration": _DURATION,
+    "alarm_snooze_duration": _DURATION,
+    "alarm_volume": _PLAIN,
+    "alarm_brightness": _PLAIN,
+    "notification_count": _COUNT,
+    "alert_count": _COUNT,
+    "error_count": _COUNT,
+    "warning_count": _COUNT,
+    "update_progress": _PERCENT_SLIDER,
+    "maintenance_progress": _PERCENT_SLIDER,
+    "analytics_score": _PERCENT_BOX,
+    "insights_score": _PERCENT_BOX,
+    "trends_score": _PERCENT_BOX,
+    "history_score": _PERCENT_BOX,
+    "settings_score": _PERCENT_BOX,
+    "configuration_score": _PERCENT_BOX,
+    "schedule_score": _PERCENT_BOX,
+    "routine_score": _PERCENT_BOX,
+})
+
+# Properties of each device number entity; other types use _PLAIN
+_DEVICE_PROPERTIES: Mapping[str, _NumberProperties] = MappingProxyType({
+    "water_level": _PERCENT_BOX,
+    "priming_progress": _PERCENT_BOX,
+    "firmware_version": _PLAIN,
+    "device_temperature": _TEMPERATURE_BOX,
+    "device_humidity": _HUMIDITY,
+    "device_pressure": _PRESSURE,
+    "notification_count": _COUNT,
+    "alert_count": _COUNT,
+    "error_count": _COUNT,
+    "warning_count": _COUNT,
+    "update_progress": _PERCENT_BOX,
+    "maintenance_progress": _PERCENT_BOX,
+    "analytics_score": _PERCENT_BOX,
+    "insights_score": _PERCENT_BOX,
+    "trends_score": _PERCENT_BOX,
+    "history_score": _PERCENT_BOX,
+    "settings_score": _PERCENT_BOX,
+    "configuration_score": _PERCENT_BOX,
+    "schedule_score": _PERCENT_BOX,
+    "routine_score": _PERCENT_BOX,
+})
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
@@ -128,99 +259,18 @@ class EightNumberEntity(EightSleepBaseEntity, NumberEntity):
 
     def _get_entity_name(self, entity_type: str) -> str:
         """Get the display name for the entity type."""
-        name_map = {
-            "target_heating_level": "Target Heating Level",
-            "heating_level": "Heating Level",
-            "target_temperature": "Target Temperature",
-            "current_temperature": "Current Temperature",
-            "room_temperature": "Room Temperature",
-            "water_level": "Water Level",
-            "priming_progress": "Priming Progress",
-            "firmware_version": "Firmware Version",
-            "device_temperature": "Device Temperature",
-            "device_humidity": "Device Humidity",
-            "device_pressure": "Device Pressure",
-            "sleep_duration": "Sleep Duration",
-            "sleep_latency": "Sleep Latency",
-            "sleep_efficiency": "Sleep Efficiency",
-            "sleep_quality": "Sleep Quality",
-            "sleep_score": "Sleep Score",
-            "heart_rate": "Heart Rate",
-            "respiratory_rate": "Respiratory Rate",
-            "hrv_value": "HRV Value",
-            "presence_duration": "Presence Duration",
-            "away_duration": "Away Duration",
-            "alarm_snooze_duration": "Alarm Snooze Duration",
-            "alarm_volume": "Alarm Volume",
-            "alarm_brightness": "Alarm Brightness",
-            "notification_count": "Notification Count",
-            "alert_count": "Alert Count",
-            "error_count": "Error Count",
-            "warning_count": "Warning Count",
-            "update_progress": "Update Progress",
-            "maintenance_progress": "Maintenance Progress",
-            "analytics_score": "Analytics Score",
-            "insights_score": "Insights Score",
-            "trends_score": "Trends Score",
-            "history_score": "History Score",
-            "settings_score": "Settings Score",
-            "configuration_score": "Configuration Score",
-            "schedule_score": "Schedule Score",
-            "routine_score": "Routine Score",
-        }
-        return name_map.get(entity_type, entity_type.replace("_", " ").title())
+        return _ENTITY_NAMES.get(entity_type) or entity_type.replace("_", " ").title()
 
     def _set_entity_properties(self, entity_type: str) -> None:
         """Set device class, unit, and mode based on entity type."""
-        if "temperature" in entity_type.lower():
-            self._attr_device_class = NumberDeviceClass.TEMPERATURE
-            self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-            self._attr_mode = NumberMode.SLIDER
-            self._attr_native_min_value = 0.0
-            self._attr_native_max_value = 50.0
-            self._attr_native_step = 0.5
-        elif "duration" in entity_type.lower() or "latency" in entity_type.lower():
-            self._attr_device_class = NumberDeviceClass.DURATION
-            self._attr_native_unit_of_measurement = UnitOfTime.SECONDS
-            self._attr_mode = NumberMode.BOX
-            self._attr_native_min_value = 0.0
-            self._attr_native_max_value = 86400.0  # 24 hours
-            self._attr_native_step = 1.0
-        elif "level" in entity_type.lower() or "progress" in entity_type.lower():
-            self._attr_device_class = None
-            self._attr_native_unit_of_measurement = PERCENTAGE
-            self._attr_mode = NumberMode.SLIDER
-            self._attr_native_min_value = 0.0
-            self._attr_native_max_value = 100.0
-            self._attr_native_step = 1.0
-        elif "rate" in entity_type.lower() or "hrv" in entity_type.lower():
-            self._attr_device_class = NumberDeviceClass.FREQUENCY
-            self._attr_native_unit_of_measurement = "bpm" if "rate" in entity_type.lower() else "ms"
-            self._attr_mode = NumberMode.BOX
-            self._attr_native_min_value = 0.0
-            self._attr_native_max_value = 200.0 if "rate" in entity_type.lower() else 1000.0
-            self._attr_native_step = 1.0
-        elif "score" in entity_type.lower():
-            self._attr_device_class = None
-            self._attr_native_unit_of_measurement = PERCENTAGE
-            self._attr_mode = NumberMode.BOX
-            self._attr_native_min_value = 0.0
-            self._attr_native_max_value = 100.0
-            self._attr_native_step = 1.0
-        elif "count" in entity_type.lower():
-            self._attr_device_class = None
-            self._attr_native_unit_of_measurement = "count"
-            self._attr_mode = NumberMode.BOX
-            self._attr_native_min_value = 0.0
-            self._attr_native_max_value = 1000.0
-            self._attr_native_step = 1.0
-        else:
-            self._attr_device_class = None
-            self._attr_native_unit_of_measurement = None
-            self._attr_mode = NumberMode.BOX
-            self._attr_native_min_value = 0.0
-            self._attr_native_max_value = 100.0
-            self._attr_native_step = 1.0
+        (
+            self._attr_device_class,
+            self._attr_native_unit_of_measurement,
+            self._attr_mode,
+            self._attr_native_min_value,
+            self._attr_native_max_value,
+            self._attr_native_step,
+        ) = _USER_PROPERTIES.get(entity_type, _PLAIN)
 
     @property
     def native_value(self) -> float | None:
@@ -421,81 +471,18 @@ class EightDeviceNumberEntity(EightSleepBaseEntity, NumberEntity):
 
     def _get_entity_name(self, entity_type: str) -> str:
         """Get the display name for the entity type."""
-        name_map = {
-            "water_level": "Water Level",
-            "priming_progress": "Priming Progress",
-            "firmware_version": "Firmware Version",
-            "device_temperature": "Device Temperature",
-            "device_humidity": "Device Humidity",
-            "device_pressure": "Device Pressure",
-            "notification_count": "Notification Count",
-            "alert_count": "Alert Count",
-            "error_count": "Error Count",
-            "warning_count": "Warning Count",
-            "update_progress": "Update Progress",
-            "maintenance_progress": "Maintenance Progress",
-            "analytics_score": "Analytics Score",
-            "insights_score": "Insights Score",
-            "trends_score": "Trends Score",
-            "history_score": "History Score",
-            "settings_score": "Settings Score",
-            "configuration_score": "Configuration Score",
-            "schedule_score": "Schedule Score",
-            "routine_score": "Routine Score",
-        }
-        return name_map.get(entity_type, entity_type.replace("_", " ").title())
+        return _ENTITY_NAMES.get(entity_type) or entity_type.replace("_", " ").title()
 
     def _set_entity_properties(self, entity_type: str) -> None:
         """Set device class, unit, and mode based on entity type."""
-        if "temperature" in entity_type.lower():
-            self._attr_device_class = NumberDeviceClass.TEMPERATURE
-            self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-            self._attr_mode = NumberMode.BOX
-            self._attr_native_min_value = 0.0
-            self._attr_native_max_value = 50.0
-            self._attr_native_step = 0.5
-        elif "humidity" in entity_type.lower():
-            self._attr_device_class = NumberDeviceClass.HUMIDITY
-            self._attr_native_unit_of_measurement = PERCENTAGE
-            self._attr_mode = NumberMode.BOX
-            self._attr_native_min_value = 0.0
-            self._attr_native_max_value = 100.0
-            self._attr_native_step = 1.0
-        elif "pressure" in entity_type.lower():
-            self._attr_device_class = NumberDeviceClass.PRESSURE
-            self._attr_native_unit_of_measurement = "hPa"
-            self._attr_mode = NumberMode.BOX
-            self._attr_native_min_value = 0.0
-            self._attr_native_max_value = 2000.0
-            self._attr_native_step = 1.0
-        elif "level" in entity_type.lower() or "progress" in entity_type.lower():
-            self._attr_device_class = None
-            self._attr_native_unit_of_measurement = PERCENTAGE
-            self._attr_mode = NumberMode.BOX
-            self._attr_native_min_value = 0.0
-            self._attr_native_max_value = 100.0
-            self._attr_native_step = 1.0
-        elif "count" in entity_type.lower():
-            self._attr_device_class = None
-            self._attr_native_unit_of_measurement = "count"
-            self._attr_mode = NumberMode.BOX
-            self._attr_native_min_value = 0.0
-            self._attr_native_max_value = 1000.0
-            self._attr_native_step = 1.0
-        elif "score" in entity_type.lower():
-            self._attr_device_class = None
-            self._attr_native_unit_of_measurement = PERCENTAGE
-            self._attr_mode = NumberMode.BOX
-            self._attr_native_min_value = 0.0
-            self._attr_native_max_value = 100.0
-            self._attr_native_step = 1.0
-        else:
-            self._attr_device_class = None
-            self._attr_native_unit_of_measurement = None
-            self._attr_mode = NumberMode.BOX
-            self._attr_native_min_value = 0.0
-            self._attr_native_max_value = 100.0
-            self._attr_native_step = 1.0
+        (
+            self._attr_device_class,
+            self._attr_native_unit_of_measurement,
+            self._attr_mode,
+            self._attr_native_min_value,
+            self._attr_native_max_value,
+            self._attr_native_step,
+        ) = _DEVICE_PROPERTIES.get(entity_type, _PLAIN)
 
     @property
     def native_value(self) -> float | None:
@@ -10,9 +10,11 @@ from typing import Any, Dict, Optional
 
 from homeassistant.const import CONF_USERNAME, UnitOfTemperature as HassUnitOfTemperature
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.storage import Store
+import voluptuous as vol
 
-from .const import DOMAIN
+from .const import ATTR_CONFIG_ENTRY_ID, DOMAIN
 from .pyEight.types import UnitOfTemperature as PyEightUnitOfTemperature
 
 _LOGGER = logging.getLogger(__name__)
@@ -23,6 +25,11 @@ STORAGE_VERSION = 1
 CACHE_EXPIRY = timedelta(hours=1)  # Cache data for 1 hour
 CONNECTION_STATUS_EXPIRY = timedelta(minutes=5)  # Connection status cache
 
+# Base schema for domain-wide services that can target one config entry
+CONFIG_ENTRY_SERVICE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+})
+
 # Enhanced logging configuration
 LOGGING_CONFIG = {
     "level": logging.INFO,
@@ -116,17 +123,23 @@ class EightSleepCache:
         self._last_update = None
         self._cache_stats = {"hits": 0, "misses": 0, "writes": 0, "errors": 0}
 
+    @property
+    def hit_rate(self) -> float:
+        """Get the cache hit rate percentage."""
+        total_requests = self._cache_stats["hits"] + self._cache_stats["misses"]
+        hit_rate = (self._cache_stats["hits"] / total_requests * 100) if total_requests > 0 else 0
+        return round(hit_rate, 2)
+
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache performance statistics."""
         total_requests = self._cache_stats["hits"] + self._cache_stats["misses"]
-        hit_rate = (self._cache_stats["hits"] / total_requests * 100) if total_requests > 0 else 0
 
         return {
             "hits": self._cache_stats["hits"],
             "misses": self._cache_stats["misses"],
             "writes": self._cache_stats["writes"],
             "errors": self._cache_stats["errors"],
-            "hit_rate": round(hit_rate, 2),
+            "hit_rate": self.hit_rate,
             "total_requests": total_requests,
             "cache_size": len(self._cache),
             "last_update": self._last_update.isoformat() if self._last_update else None,